@@ -13,6 +13,7 @@ setup(
         "markdown>=3.4.0",
         "pillow>=10.0.0",
         "python-multipart>=0.0.6",
+        "orjson>=3.9.0",
     ],
     python_requires=">=3.8",
 )
\ No newline at end of file
@@ -7,9 +7,10 @@ mod classifier;
 mod zip;
 mod processor;
 
-use anyhow::Result;
+use anyhow::{anyhow, Result};
 use std::net::SocketAddr;
 use std::sync::Arc;
+use std::time::Instant;
 use tracing::{info, Level};
 use tracing_subscriber::FmtSubscriber;
 use tower::ServiceBuilder;
@@ -18,8 +19,56 @@ use tower_http::{
     trace::TraceLayer,
 };
 
+/// `md2db parse <file> [--bench-iterations N]`
+///
+/// Prints the parsed questions as JSON on stdout. With `--bench-iterations`
+/// the file is parsed N times in-process, and the total parse time and the
+/// question count are reported on stderr as `bench_elapsed_secs=<secs>` and
+/// `COUNT:<n>`, so benchmarks neither pay a process spawn per sample nor
+/// need to decode the JSON.
+fn run_parse_command(args: &[String]) -> Result<()> {
+    let mut path = None;
+    let mut iterations: Option<u32> = None;
+
+    let mut args = args.iter();
+    while let Some(arg) = args.next() {
+        if arg == "--bench-iterations" {
+            let value = args
+                .next()
+                .ok_or_else(|| anyhow!("--bench-iterations needs a value"))?;
+            iterations = Some(value.parse::<u32>()?.max(1));
+        } else {
+            path = Some(arg);
+        }
+    }
+
+    let path = path.ok_or_else(|| anyhow!("usage: md2db parse <file> [--bench-iterations N]"))?;
+    let markdown = std::fs::read_to_string(path)?;
+
+    let start = Instant::now();
+    let mut questions = parser::parse_markdown(&markdown)?;
+    for _ in 1..iterations.unwrap_or(1) {
+        questions = parser::parse_markdown(&markdown)?;
+    }
+    let elapsed = start.elapsed();
+
+    println!("{}", serde_json::to_string(&questions)?);
+    if iterations.is_some() {
+        eprintln!("bench_elapsed_secs={:.9}", elapsed.as_secs_f64());
+        eprintln!("COUNT:{}", questions.len());
+    }
+
+    Ok(())
+}
+
 #[tokio::main]
 async fn main() -> Result<()> {
+    // One-shot parsing mode; handled before tracing so stdout stays pure JSON
+    let args: Vec<String> = std::env::args().skip(1).collect();
+    if args.first().map(String::as_str) == Some("parse") {
+        return run_parse_command(&args[1..]);
+    }
+
     // Initialize tracing
     let subscriber = FmtSubscriber::builder()
         .with_max_level(Level::INFO)
@@ -1,12 +1,23 @@
 from fastapi import FastAPI
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import JSONResponse
 from pydantic import BaseModel
 from typing import List, Optional, Dict, Any
-from functools import lru_cache
+from collections import OrderedDict
 from .parser import parse_markdown
 from .models import Question
 import hashlib
+import orjson
 
-app = FastAPI(title="MD2DB API", version="0.1.0")
+
+class OrjsonResponse(JSONResponse):
+    """JSON response serialized with orjson instead of the stdlib encoder."""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
+app = FastAPI(title="MD2DB API", version="0.1.0", default_response_class=OrjsonResponse)
 
 class ParseRequest(BaseModel):
     markdown: str
@@ -25,35 +36,30 @@ class QuestionResponse(BaseModel):
 
 def _question_to_dict(question: Question) -> Dict[str, Any]:
     """Convert Question to dict, handling None values properly."""
-    return {
-        "content": question.content,
-        "question_type": question.question_type,
-        "options": question.options,
-        "answer": question.answer,
-        "explanation": question.explanation,
-        "images": question.images,
-        "latex_formulas": question.latex_formulas
-    }
+    return question.to_dict()
 
-# Simple in-memory cache using dict for async-safe operations
-_response_cache: Dict[str, List[Dict[str, Any]]] = {}
+# Simple in-memory LRU cache; OrderedDict gives O(1) promote and evict
+_response_cache: "OrderedDict[bytes, List[Dict[str, Any]]]" = OrderedDict()
 _cache_max_size = 128
 
-def _get_cache_key(content: str) -> str:
-    """Generate cache key from content."""
-    return hashlib.sha256(content.encode()).hexdigest()
+def _get_cache_key(content: str) -> bytes:
+    """Generate cache key from content (raw BLAKE2b-128 digest)."""
+    return hashlib.blake2b(content.encode(), digest_size=16).digest()
 
-def _cache_get(key: str) -> Optional[List[Dict[str, Any]]]:
-    """Get value from cache."""
-    return _response_cache.get(key)
+def _cache_get(key: bytes) -> Optional[List[Dict[str, Any]]]:
+    """Get value from cache, marking it as most recently used."""
+    value = _response_cache.get(key)
+    if value is not None:
+        _response_cache.move_to_end(key)
+    return value
 
-def _cache_set(key: str, value: List[Dict[str, Any]]) -> None:
+def _cache_set(key: bytes, value: List[Dict[str, Any]]) -> None:
     """Set value in cache with LRU eviction."""
-    if len(_response_cache) >= _cache_max_size:
-        # Remove first (oldest) entry
-        oldest_key = next(iter(_response_cache))
-        del _response_cache[oldest_key]
     _response_cache[key] = value
+    _response_cache.move_to_end(key)
+    if len(_response_cache) > _cache_max_size:
+        # Remove least recently used entry
+        _response_cache.popitem(last=False)
 
 @app.post("/parse", response_model=ParseResponse)
 async def parse_markdown_endpoint(request: ParseRequest):
@@ -65,8 +71,8 @@ async def parse_markdown_endpoint(request: ParseRequest):
     if cached is not None:
         return {"questions": cached}
 
-    # Parse markdown
-    questions = parse_markdown(request.markdown)
+    # Parse markdown off the event loop so other requests stay responsive
+    questions = await run_in_threadpool(parse_markdown, request.markdown)
     result = [_question_to_dict(q) for q in questions]
 
     # Cache result
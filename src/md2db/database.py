@@ -1,24 +1,101 @@
-from typing import List
+from itertools import islice
+from typing import Iterable, Iterator, List, TextIO, Tuple
 from .models import Question
 
-def export_to_sql(questions: List[Question]) -> str:
-    """Export questions to SQL INSERT statements with SQL injection protection."""
-    sql_statements = []
+# 转义字符串值中的单引号来防止SQL注入
+# 这是SQL注入防护的基本方法，适用于当前生成静态SQL文件的场景
+_ESC_TABLE = str.maketrans({"'": "''"})
 
-    for i, question in enumerate(questions):
-        # 转义字符串值中的单引号来防止SQL注入
-        # 这是SQL注入防护的基本方法，适用于当前生成静态SQL文件的场景
-        content = question.content.replace("'", "''")
-        question_type = question.question_type.replace("'", "''")
+# Multi-row INSERT: the header once, then one value tuple per row
+_SQL_INSERT_HEADER = "INSERT INTO questions (id, content, question_type, options, images)\nVALUES "
+_SQL_ROW_TEMPLATE = "({}, '{}', '{}', '{}', '{}')"
+
+# PostgreSQL COPY text format: tab-separated columns, one row per line, with
+# backslash escapes for the characters that would break the layout
+_COPY_HEADER = "COPY questions (id, content, question_type, options, images) FROM stdin;"
+_COPY_ESC_TABLE = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
+
+# Same statement with DB-API placeholders; drivers bind the values, so
+# nothing needs escaping
+_SQL_PARAM_STATEMENT = (
+    "INSERT INTO questions (id, content, question_type, options, images) "
+    "VALUES (?, ?, ?, ?, ?)"
+)
+
+
+def _statement_values(i: int, question: Question) -> Tuple[int, str, str, str, str]:
+    """Return the column values of a question's INSERT statement."""
+    return (
+        i,
+        question.content,
+        question.question_type,
+        ",".join(question.options or ()),
+        ",".join(question.images or ()),
+    )
+
+
+def _format_row(i: int, question: Question) -> str:
+    """Render the escaped value tuple of a question."""
+    _, *texts = _statement_values(i, question)
+    return _SQL_ROW_TEMPLATE.format(i, *(text.translate(_ESC_TABLE) for text in texts))
+
+
+def _iter_statements(questions: Iterable[Question], batch_size: int) -> Iterator[str]:
+    """Yield INSERT statements covering up to ``batch_size`` questions each."""
+    if batch_size < 1:
+        raise ValueError(f"batch_size must be at least 1, got {batch_size}")
+    rows = (_format_row(i, question) for i, question in enumerate(questions))
+    while True:
+        batch = list(islice(rows, batch_size))
+        if not batch:
+            return
+        yield _SQL_INSERT_HEADER + ",\n".join(batch) + ";"
 
-        options_str = ",".join(question.options) if question.options else ""
-        options_str = options_str.replace("'", "''")
 
-        images_str = ",".join(question.images) if question.images else ""
-        images_str = images_str.replace("'", "''")
+def export_to_sql(questions: List[Question], batch_size: int = 1) -> str:
+    """Export questions to SQL INSERT statements with SQL injection protection.
+
+    Args:
+        questions: Questions to export
+        batch_size: Rows per multi-row INSERT. The default keeps one
+            statement per question; bulk loads run far faster with a few
+            hundred rows per statement.
+    """
+    return "\n".join(_iter_statements(questions, batch_size))
+
+
+def export_to_sql_stream(questions: Iterable[Question], writer: TextIO, batch_size: int = 1) -> None:
+    """Write SQL INSERT statements straight to a file-like writer.
+
+    Produces the same output as export_to_sql without materializing it.
+    ``questions`` may be a generator such as parser.iter_markdown.
+    """
+    for i, statement in enumerate(_iter_statements(questions, batch_size)):
+        if i:
+            writer.write("\n")
+        writer.write(statement)
+
+
+def export_to_copy(questions: Iterable[Question]) -> str:
+    """Export questions as a PostgreSQL ``COPY ... FROM stdin`` block.
+
+    Feeding the result to psql bulk-loads every row in one command, which is
+    the fastest way to get a large export into PostgreSQL.
+    """
+    lines = [_COPY_HEADER]
+    for i, question in enumerate(questions):
+        _, *texts = _statement_values(i, question)
+        lines.append("\t".join([str(i), *(text.translate(_COPY_ESC_TABLE) for text in texts)]))
+    lines.append("\\.")
+    return "\n".join(lines) + "\n"
+
 
-        sql = f"""INSERT INTO questions (id, content, question_type, options, images)
-VALUES ({i}, '{content}', '{question_type}', '{options_str}', '{images_str}');"""
-        sql_statements.append(sql)
+def export_to_sql_params(questions: Iterable[Question]) -> Tuple[str, List[tuple]]:
+    """Export questions as one parameterized INSERT plus its value rows.
 
-    return "\n".join(sql_statements)
\ No newline at end of file
+    The result plugs straight into a DB-API ``cursor.executemany(sql, rows)``
+    and inserts the same rows as running the export_to_sql script.
+    """
+    return _SQL_PARAM_STATEMENT, [
+        _statement_values(i, question) for i, question in enumerate(questions)
+    ]
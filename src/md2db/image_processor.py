@@ -1,27 +1,95 @@
-import re
-from typing import List, Tuple
+from typing import Iterator, List, Pattern, Set
 from dataclasses import dataclass
 
-# Pre-compiled regex patterns for performance
-_IMAGE_PATTERN = re.compile(r'!\[.*?\]\((.*?)\)')
-_DISPLAY_LATEX_PATTERN = re.compile(r'\$\$(.*?)\$\$', re.DOTALL)
-_INLINE_LATEX_PATTERN = re.compile(r'\$(.*?)\$')
-_LATEX_VALIDATION_PATTERNS = [
-    re.compile(r'\\[a-zA-Z]+'),  # LaTeX commands like \frac, \int
-    re.compile(r'[{}]'),          # Braces
-    re.compile(r'[\\^\\_]'),     # Superscript/subscript
-    re.compile(r'[+\\\\*/=]'),    # Mathematical operators
-]
+try:
+    # Linear-time engine for regexes that run on untrusted markdown
+    import re2 as _re
+except ImportError:
+    import re as _re
+
+# Regex patterns are compiled on first use (PEP 562 ``__getattr__``) so that
+# importing md2db stays cheap when no markdown is ever parsed.
+_PATTERN_SOURCES = {
+    '_IMAGE_PATTERN': r'!\[.*?\]\((.*?)\)',
+    # Any one of these characters marks a candidate as LaTeX: backslash commands
+    # (\frac, \int), braces, super/subscript, operators and brackets
+    '_LATEX_VALID_RE': r'[\\{}^_+*/=\[\]()]',
+}
+
+
+def __getattr__(name: str) -> Pattern:
+    """Compile a module-level pattern the first time it is accessed."""
+    try:
+        source = _PATTERN_SOURCES[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    pattern = globals()[name] = _re.compile(source)
+    return pattern
+
+
+def _compiled(name: str) -> Pattern:
+    """Return a lazily compiled pattern from inside this module."""
+    pattern = globals().get(name)
+    return pattern if pattern is not None else __getattr__(name)
 
 @dataclass
 class ExtractedContent:
     """Container for extracted content from markdown."""
     images: List[str]
     latex_formulas: List[str]
+    # Content with image tags removed, built from the same scan
+    text: str = ""
+
+def _is_valid_latex(formula: str) -> bool:
+    """Validate if string contains valid LaTeX pattern."""
+    return bool(_compiled('_LATEX_VALID_RE').search(formula))
+
+
+def _add_formula(formulas: List[str], seen: Set[str], formula: str) -> None:
+    """Append a formula once, skipping blanks and non-LaTeX text."""
+    if formula and formula not in seen and _is_valid_latex(formula):
+        formulas.append(formula)
+        seen.add(formula)
+
+
+def _iter_display_bodies(content: str) -> Iterator[str]:
+    """Yield the body of each ``$$...$$`` span, leftmost first.
+
+    Matches what ``re.finditer(r'\$\$(.*?)\$\$', content, re.DOTALL)`` would
+    find, using ``str.find`` so that unclosed ``$$`` runs stay linear.
+    """
+    start = content.find('$$')
+    while start != -1:
+        end = content.find('$$', start + 2)
+        if end == -1:
+            return
+        yield content[start + 2:end]
+        start = content.find('$$', end + 2)
+
+
+def _iter_inline_bodies(content: str) -> Iterator[str]:
+    """Yield the body of each ``$...$`` span on a single line.
+
+    Matches what ``re.finditer(r'\$(.*?)\$', content)`` would find. This scan
+    is independent of the display one, so ``$$`` pairs show up here as empty
+    bodies.
+    """
+    start = content.find('$')
+    while start != -1:
+        end = content.find('$', start + 1)
+        if end == -1:
+            return
+        if content.find('\n', start + 1, end) != -1:
+            # Inline formulas cannot span lines; retry from the next dollar
+            start = end
+            continue
+        yield content[start + 1:end]
+        start = content.find('$', end + 1)
+
 
 def extract_images(content: str) -> List[str]:
     """Extract image URLs from markdown content."""
-    matches = _IMAGE_PATTERN.findall(content)
+    matches = _compiled('_IMAGE_PATTERN').findall(content)
     return matches
 
 def extract_latex_formulas(content: str) -> List[str]:
@@ -33,98 +101,44 @@ def extract_latex_formulas(content: str) -> List[str]:
     Returns:
         List of LaTeX formula strings
     """
-    formulas = []
-    seen_formulas = set()  # Track seen formulas to avoid duplicates
-
-    def add_formula(formula: str):
-        """Helper to add formula with validation."""
-        if formula.strip() and formula not in seen_formulas:
-            if _is_valid_latex(formula):
-                formulas.append(formula)
-                seen_formulas.add(formula)
-
-    def _is_valid_latex(formula: str) -> bool:
-        """Validate if string contains valid LaTeX pattern."""
-        for pattern in _LATEX_VALIDATION_PATTERNS:
-            if pattern.search(formula):
-                return True
-
-        # Allow simple mathematical expressions like x^2
-        if len(formula) > 1 and any(c in formula for c in '^_[](){}'):
-            return True
-
-        return False
-
-    # Extract display LaTeX formulas ($$...$$)
-    display_matches = _DISPLAY_LATEX_PATTERN.findall(content)
-    for match in display_matches:
-        add_formula(match.strip())
-
-    # Extract inline LaTeX formulas ($...$)
-    inline_matches = _INLINE_LATEX_PATTERN.findall(content)
-    for match in inline_matches:
-        formula = match.strip()
-        # Skip obvious false positives
-        if (formula and
-            not formula.startswith('$') and
-            not formula.endswith('$') and
-            '$' not in formula):
-            add_formula(formula)
-
-    return formulas
+    return extract_all(content).latex_formulas
 
 
 def extract_all(content: str) -> ExtractedContent:
-    """Extract all media content (images and LaTeX) in a single pass.
+    """Extract all media content (images and LaTeX) in one call.
 
-    This is more efficient than calling extract_images and extract_latex_formulas
-    separately, as it only iterates through the content once.
+    Each scan is skipped when the content lacks its opening marker ('![' or
+    '$'), and the image scan also yields the content with tags removed.
 
     Args:
         content: Markdown content
 
     Returns:
-        ExtractedContent containing images and LaTeX formulas
+        ExtractedContent containing images, LaTeX formulas and the content
+        with image tags stripped
     """
-    images = _IMAGE_PATTERN.findall(content)
-
-    # Extract LaTeX formulas (reuse existing logic)
+    images = []
+    text_parts = []
+    last_end = 0
     formulas = []
-    seen_formulas = set()
-
-    def add_formula(formula: str):
-        """Helper to add formula with validation."""
-        if formula.strip() and formula not in seen_formulas:
-            if _is_valid_latex(formula):
-                formulas.append(formula)
-                seen_formulas.add(formula)
-
-    def _is_valid_latex(formula: str) -> bool:
-        """Validate if string contains valid LaTeX pattern."""
-        for pattern in _LATEX_VALIDATION_PATTERNS:
-            if pattern.search(formula):
-                return True
-
-        # Allow simple mathematical expressions like x^2
-        if len(formula) > 1 and any(c in formula for c in '^_[](){}'):
-            return True
-
-        return False
-
-    # Extract display LaTeX formulas ($$...$$)
-    display_matches = _DISPLAY_LATEX_PATTERN.findall(content)
-    for match in display_matches:
-        add_formula(match.strip())
-
-    # Extract inline LaTeX formulas ($...$)
-    inline_matches = _INLINE_LATEX_PATTERN.findall(content)
-    for match in inline_matches:
-        formula = match.strip()
-        # Skip obvious false positives
-        if (formula and
-            not formula.startswith('$') and
-            not formula.endswith('$') and
-            '$' not in formula):
-            add_formula(formula)
-
-    return ExtractedContent(images=images, latex_formulas=formulas)
\ No newline at end of file
+    seen_formulas = set()  # Track seen formulas to avoid duplicates
+
+    # Image tags are found independently of LaTeX spans, so a tag that
+    # overlaps a '$' span is still extracted and stripped
+    if '![' in content:
+        for image in _compiled('_IMAGE_PATTERN').finditer(content):
+            images.append(image.group(1))
+            text_parts.append(content[last_end:image.start()])
+            last_end = image.end()
+
+    # Display formulas ($$...$$) are kept ahead of inline ones ($...$). The two
+    # scans are independent, so an inline span never hides a display one.
+    if '$' in content:
+        for body in _iter_display_bodies(content):
+            _add_formula(formulas, seen_formulas, body.strip())
+        for body in _iter_inline_bodies(content):
+            _add_formula(formulas, seen_formulas, body.strip())
+
+    text_parts.append(content[last_end:])
+
+    return ExtractedContent(images=images, latex_formulas=formulas, text=''.join(text_parts))
\ No newline at end of file
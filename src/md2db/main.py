@@ -1,23 +1,59 @@
 import argparse
-from .parser import parse_markdown
-from .database import export_to_sql
+import atexit
+from typing import Dict
+from pymongo import MongoClient
+from .parser import iter_markdown, parse_markdown
+from .database import export_to_sql, export_to_sql_stream
 from .parallel.coordinator import ParallelProcessor
 
 
-def process_file(filename: str) -> dict:
-    """Process a markdown file and return structured data."""
+def _read_markdown(filename: str) -> str:
+    """Read a markdown file as UTF-8 text."""
     with open(filename, 'r', encoding='utf-8') as f:
-        content = f.read()
+        return f.read()
 
-    questions = parse_markdown(content)
+
+def process_content(markdown: str) -> dict:
+    """Process markdown text and return structured data."""
+    questions = parse_markdown(markdown)
     sql_output = export_to_sql(questions)
 
     return {
-        "questions": [q.__dict__ for q in questions],
+        "questions": [q.to_dict() for q in questions],
         "sql": sql_output
     }
 
 
+def process_file(filename: str) -> dict:
+    """Process a markdown file and return structured data."""
+    return process_content(_read_markdown(filename))
+
+
+# One client per URI for the life of the process. None is ever evicted, so
+# no connection pool or monitor thread is left open without an owner.
+_clients: Dict[str, MongoClient] = {}
+
+
+def _get_client(database_uri: str) -> MongoClient:
+    """Return a MongoClient for ``database_uri``, shared by every call in this process.
+
+    Processing several files then reuses one connection pool instead of
+    repeating the connection handshake per file.
+    """
+    client = _clients.get(database_uri)
+    if client is None:
+        client = _clients[database_uri] = MongoClient(database_uri)
+    return client
+
+
+@atexit.register
+def _close_clients() -> None:
+    """Close every cached client; runs at interpreter exit."""
+    while _clients:
+        _, client = _clients.popitem()
+        client.close()
+
+
 def process_file_parallel(
     filename: str,
     database_uri: str = "mongodb://localhost:27017",
@@ -42,7 +78,8 @@ def process_file_parallel(
         database_uri=database_uri,
         database_name=database_name,
         num_workers=num_workers,
-        chunk_size_mb=chunk_size_mb
+        chunk_size_mb=chunk_size_mb,
+        client=_get_client(database_uri)
     )
 
     return processor.process()
@@ -73,11 +110,13 @@ def main():
         print(f"Using {result['num_workers']} workers across {result['chunks_processed']} chunks")
     else:
         # Original mode
-        result = process_file(args.file)
-
         if args.output:
+            # Stream statements to the file instead of building one big string;
+            # each question is parsed right before its INSERT is written
+            questions = iter_markdown(_read_markdown(args.file))
             with open(args.output, 'w', encoding='utf-8') as f:
-                f.write(result["sql"])
+                export_to_sql_stream(questions, f)
             print(f"Output written to {args.output}")
         else:
+            result = process_file(args.file)
             print(result["sql"])
\ No newline at end of file
@@ -1,7 +1,13 @@
-from dataclasses import dataclass
-from typing import List, Optional
+import sys
+from dataclasses import dataclass, fields
+from operator import attrgetter
+from typing import Any, Dict, List, Optional
 
-@dataclass
+# Slotted instances drop the per-question __dict__ (about a third of the
+# object's memory); dataclass only supports slots=True from Python 3.10
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(**_SLOTS)
 class Question:
     content: str
     question_type: str
@@ -9,4 +15,13 @@ class Question:
     answer: Optional[str] = None
     explanation: Optional[str] = None
     images: Optional[List[str]] = None
-    latex_formulas: Optional[List[str]] = None
\ No newline at end of file
+    latex_formulas: Optional[List[str]] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the fields as a new dict, sharing the list values."""
+        # dataclasses.asdict would deep-copy every list
+        return dict(zip(_QUESTION_FIELDS, _get_question_fields(self)))
+
+
+_QUESTION_FIELDS = tuple(f.name for f in fields(Question))
+_get_question_fields = attrgetter(*_QUESTION_FIELDS)
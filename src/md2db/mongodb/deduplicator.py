@@ -1,55 +1,165 @@
-from typing import Optional
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+from pymongo.collection import Collection
 from pymongo.database import Database
+from pymongo.errors import BulkWriteError
 from .models import OptionDocument, ImageDocument, LatexDocument
 
+_DUPLICATE_KEY_ERROR = 11000
+
 
 class Deduplicator:
     """Handles deduplication and storage of options, images, and latex formulas."""
 
+    # Upper bound on remembered hash -> id entries per collection
+    _id_cache_max_size = 100_000
+
     def __init__(self, db: Database):
         self.db = db
+        # Ids this process already resolved, so repeats skip the round-trip
+        self._id_cache: Dict[str, "OrderedDict[str, str]"] = {}
         self._setup_indexes()
 
     def _setup_indexes(self):
-        """Ensure unique indexes exist on hash fields."""
+        """Ensure unique indexes exist on hash fields.
+
+        Runs once per Deduplicator (one per import run) rather than once per
+        client, so a database dropped between runs gets its indexes back.
+        """
         self.db.options.create_index("hash", unique=True)
         self.db.images.create_index("hash", unique=True)
         self.db.latex_formulas.create_index("hash", unique=True)
 
     def get_or_create_option(self, option: OptionDocument) -> Optional[str]:
         """Get existing option or create new one. Returns ObjectId as string."""
+        cached = self._cached_id(self.db.options, option.hash)
+        if cached is not None:
+            return cached
+
         existing = self.db.options.find_one({"hash": option.hash})
         if existing:
-            return str(existing["_id"])
+            return self._remember_id(self.db.options, option.hash, existing["_id"])
 
         result = self.db.options.insert_one({
             "label": option.label,
             "content": option.content,
             "hash": option.hash
         })
-        return str(result.inserted_id)
+        return self._remember_id(self.db.options, option.hash, result.inserted_id)
 
     def get_or_create_image(self, image: ImageDocument) -> Optional[str]:
         """Get existing image or create new one. Returns ObjectId as string."""
+        cached = self._cached_id(self.db.images, image.hash)
+        if cached is not None:
+            return cached
+
         existing = self.db.images.find_one({"hash": image.hash})
         if existing:
-            return str(existing["_id"])
+            return self._remember_id(self.db.images, image.hash, existing["_id"])
 
         result = self.db.images.insert_one({
             "url": image.url,
             "alt": image.alt,
             "hash": image.hash
         })
-        return str(result.inserted_id)
+        return self._remember_id(self.db.images, image.hash, result.inserted_id)
 
     def get_or_create_latex(self, latex: LatexDocument) -> Optional[str]:
         """Get existing latex or create new one. Returns ObjectId as string."""
+        cached = self._cached_id(self.db.latex_formulas, latex.hash)
+        if cached is not None:
+            return cached
+
         existing = self.db.latex_formulas.find_one({"hash": latex.hash})
         if existing:
-            return str(existing["_id"])
+            return self._remember_id(self.db.latex_formulas, latex.hash, existing["_id"])
 
         result = self.db.latex_formulas.insert_one({
             "formula": latex.formula,
             "hash": latex.hash
         })
-        return str(result.inserted_id)
+        return self._remember_id(self.db.latex_formulas, latex.hash, result.inserted_id)
+
+    def get_or_create_options_batch(self, options: List[OptionDocument]) -> Dict[str, str]:
+        """Get or create many options at once. Returns hash -> ObjectId as string."""
+        return self._get_or_create_many(self.db.options, [
+            {"label": option.label, "content": option.content, "hash": option.hash}
+            for option in options
+        ])
+
+    def get_or_create_images_batch(self, images: List[ImageDocument]) -> Dict[str, str]:
+        """Get or create many images at once. Returns hash -> ObjectId as string."""
+        return self._get_or_create_many(self.db.images, [
+            {"url": image.url, "alt": image.alt, "hash": image.hash}
+            for image in images
+        ])
+
+    def get_or_create_latex_batch(self, formulas: List[LatexDocument]) -> Dict[str, str]:
+        """Get or create many latex formulas at once. Returns hash -> ObjectId as string."""
+        return self._get_or_create_many(self.db.latex_formulas, [
+            {"formula": latex.formula, "hash": latex.hash}
+            for latex in formulas
+        ])
+
+    def _get_or_create_many(self, collection: Collection, documents: List[Dict[str, Any]]) -> Dict[str, str]:
+        """Resolve documents by hash with one ``find``, then ``insert_many`` the misses.
+
+        The unordered insert lets the server apply the batch in parallel. Hashes
+        that lose a race with another writer (duplicate key) are looked up again.
+        """
+        unique = {doc["hash"]: doc for doc in documents}
+        ids = {}
+        for h in list(unique):
+            cached = self._cached_id(collection, h)
+            if cached is not None:
+                ids[h] = cached
+                del unique[h]
+        if not unique:
+            return ids
+
+        self._find_ids(collection, list(unique), ids)
+        new_docs = [doc for h, doc in unique.items() if h not in ids]
+        if not new_docs:
+            return ids
+
+        failed = set()
+        try:
+            # insert_many fills in each document's _id client-side
+            collection.insert_many(new_docs, ordered=False)
+        except BulkWriteError as exc:
+            for error in exc.details.get("writeErrors", []):
+                if error.get("code") != _DUPLICATE_KEY_ERROR:
+                    raise
+                failed.add(error["index"])
+
+        for index, doc in enumerate(new_docs):
+            if index not in failed:
+                ids[doc["hash"]] = self._remember_id(collection, doc["hash"], doc["_id"])
+        if failed:
+            self._find_ids(collection, [new_docs[index]["hash"] for index in failed], ids)
+
+        return ids
+
+    def _find_ids(self, collection: Collection, hashes: List[str], ids: Dict[str, str]) -> None:
+        """Look up existing documents by hash in one query and record their ids."""
+        for doc in collection.find({"hash": {"$in": hashes}}, {"hash": 1}):
+            ids[doc["hash"]] = self._remember_id(collection, doc["hash"], doc["_id"])
+
+    def _cached_id(self, collection: Collection, content_hash: str) -> Optional[str]:
+        """Return a previously resolved id for this hash, if still cached."""
+        cache = self._id_cache.get(collection.name)
+        if cache is None:
+            return None
+        cached = cache.get(content_hash)
+        if cached is not None:
+            cache.move_to_end(content_hash)
+        return cached
+
+    def _remember_id(self, collection: Collection, content_hash: str, _id: Any) -> str:
+        """Cache a resolved id (LRU-bounded) and return it as a string."""
+        cache = self._id_cache.setdefault(collection.name, OrderedDict())
+        cache[content_hash] = id_str = str(_id)
+        cache.move_to_end(content_hash)
+        if len(cache) > self._id_cache_max_size:
+            cache.popitem(last=False)
+        return id_str
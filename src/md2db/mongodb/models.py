@@ -1,17 +1,25 @@
 from dataclasses import dataclass, field
 from typing import List, Optional
 from datetime import datetime
+from functools import lru_cache
 import hashlib
 
+# Upper bound on memoized side documents per process for each type
+_DOCUMENT_CACHE_SIZE = 100_000
+
 
 def generate_hash(content: str) -> str:
-    """Generate SHA256 hash for content."""
+    """Generate SHA256 hash for content.
+
+    The hex digest is the stored dedup key, so changing the algorithm would
+    stop new imports from matching documents already in the database.
+    """
     return hashlib.sha256(content.encode()).hexdigest()
 
 
-@dataclass
+@dataclass(frozen=True)
 class OptionDocument:
-    """MongoDB document for question options."""
+    """MongoDB document for question options (immutable, so instances can be shared)."""
     label: str
     content: str
     hash: str = field(default=None)
@@ -19,30 +27,48 @@ class OptionDocument:
     def __post_init__(self):
         if self.hash is None:
             combined = f"{self.label}:{self.content}"
-            self.hash = generate_hash(combined)
+            object.__setattr__(self, "hash", generate_hash(combined))
 
+    @classmethod
+    @lru_cache(maxsize=_DOCUMENT_CACHE_SIZE)
+    def from_content(cls, label: str, content: str) -> "OptionDocument":
+        """Return a shared document for an option, hashing it only the first time."""
+        return cls(label=label, content=content)
 
-@dataclass
+
+@dataclass(frozen=True)
 class ImageDocument:
-    """MongoDB document for images."""
+    """MongoDB document for images (immutable, so instances can be shared)."""
     url: str
     alt: str = ""
     hash: str = field(default=None)
 
     def __post_init__(self):
         if self.hash is None:
-            self.hash = generate_hash(self.url)
+            object.__setattr__(self, "hash", generate_hash(self.url))
 
+    @classmethod
+    @lru_cache(maxsize=_DOCUMENT_CACHE_SIZE)
+    def from_url(cls, url: str) -> "ImageDocument":
+        """Return a shared document for an image URL, hashing it only the first time."""
+        return cls(url=url)
 
-@dataclass
+
+@dataclass(frozen=True)
 class LatexDocument:
-    """MongoDB document for LaTeX formulas."""
+    """MongoDB document for LaTeX formulas (immutable, so instances can be shared)."""
     formula: str
     hash: str = field(default=None)
 
     def __post_init__(self):
         if self.hash is None:
-            self.hash = generate_hash(self.formula)
+            object.__setattr__(self, "hash", generate_hash(self.formula))
+
+    @classmethod
+    @lru_cache(maxsize=_DOCUMENT_CACHE_SIZE)
+    def from_formula(cls, formula: str) -> "LatexDocument":
+        """Return a shared document for a formula, hashing it only the first time."""
+        return cls(formula=formula)
 
 
 @dataclass
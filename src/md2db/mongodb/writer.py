@@ -1,4 +1,6 @@
+from concurrent.futures import Executor, Future
 from typing import List, Optional
+from pymongo import WriteConcern
 from pymongo.database import Database
 from .models import QuestionDocument
 from .deduplicator import Deduplicator
@@ -7,15 +9,39 @@ from .deduplicator import Deduplicator
 class BatchWriter:
     """Buffers and writes questions to MongoDB in batches."""
 
-    def __init__(self, db: Database, batch_size: int = 1000, deduplicator: Optional[Deduplicator] = None):
+    def __init__(
+        self,
+        db: Database,
+        batch_size: int = 1000,
+        deduplicator: Optional[Deduplicator] = None,
+        write_concern: Optional[WriteConcern] = None,
+        executor: Optional[Executor] = None
+    ):
+        """
+        Args:
+            db: Target database
+            batch_size: Number of buffered questions that triggers a flush
+            deduplicator: Deduplicator resolving the side collections
+            write_concern: Write concern for question inserts, e.g.
+                ``WriteConcern(w=0)`` for bulk ingest that does not need
+                acknowledgements. Defaults to the database's own.
+            executor: Run each flush's insert_many on this executor so the
+                caller keeps working while it is in flight. At most one flush
+                is outstanding; call wait() before relying on the writes.
+        """
         self.db = db
         self.batch_size = batch_size
         self.deduplicator = deduplicator
+        self._questions = db.questions
+        if write_concern is not None:
+            self._questions = db.questions.with_options(write_concern=write_concern)
+        self._executor = executor
+        self._pending: Optional[Future] = None
         self._buffer: List[QuestionDocument] = []
         self._setup_indexes()
 
     def _setup_indexes(self):
-        """Ensure indexes exist on questions collection."""
+        """Ensure indexes exist on questions collection (once per writer)."""
         self.db.questions.create_index("question_type")
         self.db.questions.create_index([("created_at", -1)])
 
@@ -30,9 +56,8 @@ class BatchWriter:
         if not self._buffer:
             return
 
-        documents = []
-        for doc in self._buffer:
-            doc_dict = {
+        documents = [
+            {
                 "content": doc.content,
                 "question_type": doc.question_type,
                 "options": doc.options,
@@ -42,9 +67,23 @@ class BatchWriter:
                 "latex_formulas": doc.latex_formulas,
                 "created_at": doc.created_at
             }
-            documents.append(doc_dict)
+            for doc in self._buffer
+        ]
 
-        if documents:
-            self.db.questions.insert_many(documents, ordered=False)
+        if self._executor is None:
+            # Keep the buffer until the insert succeeds so a failed flush can be retried
+            self._questions.insert_many(documents, ordered=False)
+            self._buffer.clear()
+            return
 
+        # Double-buffer: let the previous batch land (and surface its error)
+        # before handing the next one off
+        self.wait()
         self._buffer.clear()
+        self._pending = self._executor.submit(self._questions.insert_many, documents, ordered=False)
+
+    def wait(self):
+        """Block until the in-flight flush, if any, has been written."""
+        pending, self._pending = self._pending, None
+        if pending is not None:
+            pending.result()
@@ -1,7 +1,13 @@
+import mmap
 import os
-import re
 from typing import List, Tuple
 
+try:
+    # Linear-time engine for regexes that run on untrusted markdown
+    import re2 as _re
+except ImportError:
+    import re as _re
+
 
 QUESTION_SEPARATORS = [
     r'^\d+\.\s+',           # 1. 2. 3.
@@ -10,6 +16,19 @@ QUESTION_SEPARATORS = [
 ]
 
 
+def __getattr__(name: str):
+    """Compile the separator regex on first access (PEP 562)."""
+    if name != '_SEP_RE':
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # Single alternation so one scan finds the nearest separator of any kind.
+    # Compiled as bytes so it can run directly over an mmap of the file.
+    # Multiline mode is set inline since re2 has no flag constants.
+    pattern = globals()[name] = _re.compile(
+        ('(?m)' + '|'.join(f'(?:{p})' for p in QUESTION_SEPARATORS)).encode()
+    )
+    return pattern
+
+
 class FileChunker:
     """Divides large files into chunks aligned with question boundaries."""
 
@@ -34,15 +53,13 @@ class FileChunker:
 
     def _create_raw_chunks(self) -> List[Tuple[int, int]]:
         """Create rough chunks based on file size."""
-        chunks = []
-        start = 0
+        size = self.chunk_size_bytes
+        count = (self.file_size + size - 1) // size
 
-        while start < self.file_size:
-            end = min(start + self.chunk_size_bytes, self.file_size)
-            chunks.append((start, end))
-            start = end
-
-        return chunks
+        return [
+            (i * size, min((i + 1) * size, self.file_size))
+            for i in range(count)
+        ]
 
     def _adjust_boundaries(self, raw_chunks: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
         """Adjust chunk boundaries to align with question separators."""
@@ -50,33 +67,44 @@ class FileChunker:
             return []
 
         adjusted = []
-        with open(self.file_path, 'r', encoding='utf-8') as f:
-            prev_end = 0
-
-            for i, (start, end) in enumerate(raw_chunks):
-                # For all chunks except the last, find the next question separator
-                if i < len(raw_chunks) - 1:
-                    f.seek(end)
-                    adjusted_end = self._find_next_separator(f, end)
-                    adjusted.append((prev_end, adjusted_end))
-                    prev_end = adjusted_end
-                else:
-                    # Last chunk goes to end of file
-                    adjusted.append((prev_end, self.file_size))
+        fd = os.open(self.file_path, os.O_RDONLY)
+        try:
+            # Scan the mapped file in place so offsets stay in bytes
+            with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mm:
+                prev_end = 0
+
+                for i, (start, end) in enumerate(raw_chunks):
+                    # For all chunks except the last, find the next question separator
+                    if i < len(raw_chunks) - 1:
+                        # Never move backwards past the previous boundary
+                        adjusted_end = max(self._find_next_separator(mm, end), prev_end)
+                        adjusted.append((prev_end, adjusted_end))
+                        prev_end = adjusted_end
+                    else:
+                        # Last chunk goes to end of file
+                        adjusted.append((prev_end, self.file_size))
+        finally:
+            os.close(fd)
 
         return adjusted
 
-    def _find_next_separator(self, f, start_pos: int) -> int:
-        """Find the next question separator starting from position."""
+    def _find_next_separator(self, mm: mmap.mmap, start_pos: int) -> int:
+        """Find the next question separator starting from byte position."""
         max_search = 10000  # Don't search more than 10KB
-        f.seek(start_pos)
-
-        content = f.read(max_search)
-        for pattern in QUESTION_SEPARATORS:
-            matches = re.finditer(pattern, content, re.MULTILINE)
-            for match in matches:
-                # Found a separator
-                return start_pos + match.start()
 
-        # No separator found, return original position
-        return start_pos
+        sep_re = globals().get('_SEP_RE') or __getattr__('_SEP_RE')
+        match = sep_re.search(mm, start_pos, start_pos + max_search)
+        if match:
+            return match.start()
+
+        # No separator found: fall back to the next line start so the boundary
+        # never splits a multi-byte UTF-8 character
+        newline = mm.find(b"\n", start_pos)
+        if newline != -1:
+            return newline + 1
+
+        # No newline either: back up to the start of the current codepoint
+        pos = start_pos
+        while pos > 0 and mm[pos] & 0xC0 == 0x80:
+            pos -= 1
+        return pos
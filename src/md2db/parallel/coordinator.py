@@ -1,14 +1,19 @@
 import os
-from typing import Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional
 from multiprocessing import Pool
-from pymongo import MongoClient
+from pymongo import MongoClient, WriteConcern
 from .chunker import FileChunker
-from .worker import parse_chunk
+from .worker import parse_file_chunk, option_labels, _init_worker
 from ..mongodb.writer import BatchWriter
 from ..mongodb.deduplicator import Deduplicator
 from ..mongodb.models import QuestionDocument, ImageDocument, LatexDocument, OptionDocument
 
 
+# Threads issuing MongoDB writes: one per side collection plus the question flush
+_WRITE_THREADS = 4
+
+
 class ParallelProcessor:
     """Coordinates parallel processing of large markdown files."""
 
@@ -19,14 +24,35 @@ class ParallelProcessor:
         database_name: str = "md2db",
         num_workers: int = 4,
         chunk_size_mb: float = 10,
-        batch_size: int = 1000
+        batch_size: int = 5000,
+        durable: bool = True,
+        client: Optional[MongoClient] = None
     ):
+        """
+        Args:
+            file_path: Markdown file to process
+            database_uri: MongoDB connection URI
+            database_name: Database name
+            num_workers: Number of parallel workers
+            chunk_size_mb: Chunk size in MB
+            batch_size: Questions buffered per insert_many
+            durable: Wait for the server to acknowledge question inserts.
+                Pass False for bulk ingest to write the ``questions``
+                collection with ``w=0``; failed writes then go unreported.
+                Side-collection inserts always stay acknowledged, since
+                deduplication relies on their duplicate-key errors.
+            client: Existing MongoClient to write through. The caller keeps
+                ownership and it is left open; by default a client is created
+                for ``database_uri`` and closed after processing.
+        """
         self.file_path = file_path
         self.database_uri = database_uri
         self.database_name = database_name
         self.num_workers = num_workers
         self.chunk_size_mb = chunk_size_mb
         self.batch_size = batch_size
+        self.durable = durable
+        self.client = client
 
     def process(self) -> Dict[str, Any]:
         """Process the file with parallel workers.
@@ -34,8 +60,9 @@ class ParallelProcessor:
         Returns:
             Dict with processing statistics
         """
-        # Create MongoDB connection
-        client = MongoClient(self.database_uri)
+        # Reuse the caller's connection pool, or open one just for this run
+        owns_client = self.client is None
+        client = MongoClient(self.database_uri) if owns_client else self.client
         db = client[self.database_name]
 
         try:
@@ -43,68 +70,30 @@ class ParallelProcessor:
             chunker = FileChunker(self.file_path, self.chunk_size_mb)
             chunks = chunker.create_chunks()
 
-            # Setup writer and deduplicator
-            deduplicator = Deduplicator(db)
-            writer = BatchWriter(db, self.batch_size, deduplicator)
-
             # Process chunks in parallel
             questions_processed = 0
 
-            with open(self.file_path, 'r', encoding='utf-8') as f:
-                with Pool(self.num_workers) as pool:
-                    # Read chunks and process in parallel
-                    chunk_contents = []
-                    for start, end in chunks:
-                        f.seek(start)
-                        content = f.read(end - start)
-                        chunk_contents.append(content)
-
-                    # Process all chunks
-                    results = pool.map(parse_chunk, chunk_contents)
-
-                    # Write results with deduplication
-                    for chunk_results in results:
-                        for doc_dict in chunk_results:
-                            # Process images
-                            image_ids = []
-                            for img_url in doc_dict.get("images", []):
-                                img_doc = ImageDocument(url=img_url)
-                                img_id = deduplicator.get_or_create_image(img_doc)
-                                if img_id:
-                                    image_ids.append(img_id)
-
-                            # Process latex
-                            latex_ids = []
-                            for formula in doc_dict.get("latex_formulas", []):
-                                latex_doc = LatexDocument(formula=formula)
-                                latex_id = deduplicator.get_or_create_latex(latex_doc)
-                                if latex_id:
-                                    latex_ids.append(latex_id)
-
-                            # Process options
-                            option_ids = []
-                            for i, opt_content in enumerate(doc_dict.get("options", [])):
-                                label = chr(65 + i)  # A, B, C, ...
-                                opt_doc = OptionDocument(label=label, content=opt_content)
-                                opt_id = deduplicator.get_or_create_option(opt_doc)
-                                if opt_id:
-                                    option_ids.append(opt_id)
-
-                            # Create question document
-                            question_doc = QuestionDocument(
-                                content=doc_dict["content"],
-                                question_type=doc_dict["question_type"],
-                                options=option_ids,
-                                answer=doc_dict.get("answer"),
-                                explanation=doc_dict.get("explanation"),
-                                images=image_ids,
-                                latex_formulas=latex_ids
-                            )
-                            writer.add(question_doc)
-                            questions_processed += 1
-
-            # Final flush
-            writer.flush()
+            # PyMongo releases the GIL while waiting on the server, so writes on
+            # these threads overlap each other and the parse results still arriving
+            with ThreadPoolExecutor(max_workers=_WRITE_THREADS) as executor:
+                # Setup writer and deduplicator
+                deduplicator = Deduplicator(db)
+                write_concern = None if self.durable else WriteConcern(w=0)
+                writer = BatchWriter(db, self.batch_size, deduplicator, write_concern, executor)
+
+                # Each worker warms its parser once; all writes stay in this process
+                with Pool(self.num_workers, initializer=_init_worker) as pool:
+                    chunksize = max(1, len(chunks) // (self.num_workers * 4))
+                    # Workers read their own byte range; only offsets cross the pipe
+                    tasks = [(self.file_path, start, end) for start, end in chunks]
+
+                    # Write results with batched deduplication as each chunk finishes
+                    for chunk_results in pool.imap_unordered(parse_file_chunk, tasks, chunksize=chunksize):
+                        questions_processed += self._write_chunk(chunk_results, deduplicator, writer, executor)
+
+                # Final flush
+                writer.flush()
+                writer.wait()
 
             return {
                 "questions_processed": questions_processed,
@@ -112,4 +101,65 @@ class ParallelProcessor:
                 "num_workers": self.num_workers
             }
         finally:
-            client.close()
+            if owns_client:
+                client.close()
+
+    def _write_chunk(
+        self,
+        chunk_results: List[Dict[str, Any]],
+        deduplicator: Deduplicator,
+        writer: BatchWriter,
+        executor: ThreadPoolExecutor
+    ) -> int:
+        """Deduplicate one chunk's images, latex and options in bulk, then queue its questions.
+
+        Returns:
+            Number of questions queued
+        """
+        images: Dict[str, ImageDocument] = {}
+        formulas: Dict[str, LatexDocument] = {}
+        options: Dict[str, OptionDocument] = {}
+        question_hashes = []
+
+        # Workers already hashed every item; only look up one document per hash
+        for doc_dict in chunk_results:
+            image_hashes = doc_dict["image_hashes"]
+            for img_url, img_hash in zip(doc_dict["images"], image_hashes):
+                if img_hash not in images:
+                    images[img_hash] = ImageDocument.from_url(img_url)
+
+            latex_hashes = doc_dict["latex_hashes"]
+            for formula, latex_hash in zip(doc_dict["latex_formulas"], latex_hashes):
+                if latex_hash not in formulas:
+                    formulas[latex_hash] = LatexDocument.from_formula(formula)
+
+            option_hashes = doc_dict["option_hashes"]
+            labels = option_labels(len(option_hashes))
+            for label, opt_content, opt_hash in zip(labels, doc_dict["options"], option_hashes):
+                if opt_hash not in options:
+                    options[opt_hash] = OptionDocument.from_content(label, opt_content)
+
+            question_hashes.append((image_hashes, latex_hashes, option_hashes))
+
+        # One bulk round-trip per collection instead of one per item, with the
+        # three collections resolved concurrently; result() re-raises failures
+        image_future = executor.submit(deduplicator.get_or_create_images_batch, list(images.values()))
+        latex_future = executor.submit(deduplicator.get_or_create_latex_batch, list(formulas.values()))
+        option_future = executor.submit(deduplicator.get_or_create_options_batch, list(options.values()))
+        image_ids = image_future.result()
+        latex_ids = latex_future.result()
+        option_ids = option_future.result()
+
+        for doc_dict, (image_hashes, latex_hashes, option_hashes) in zip(chunk_results, question_hashes):
+            question_doc = QuestionDocument(
+                content=doc_dict["content"],
+                question_type=doc_dict["question_type"],
+                options=[option_ids[h] for h in option_hashes],
+                answer=doc_dict.get("answer"),
+                explanation=doc_dict.get("explanation"),
+                images=[image_ids[h] for h in image_hashes],
+                latex_formulas=[latex_ids[h] for h in latex_hashes]
+            )
+            writer.add(question_doc)
+
+        return len(chunk_results)
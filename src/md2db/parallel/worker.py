@@ -1,5 +1,27 @@
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple
 from ..parser import parse_markdown
+from ..mongodb.models import ImageDocument, LatexDocument, OptionDocument
+
+# Option labels by position: A, B, C, ...
+_LABELS = tuple('ABCDEFGHIJKLMNOPQRSTUVWXYZ')
+
+# Touches every parser pattern so lazily compiled ones are built up front
+_WARMUP_MARKDOWN = "1. Warm ![a](a.png) $x$ $$y$$\nA. one\nB. two"
+
+
+def _init_worker() -> None:
+    """Pool initializer: warm the regex caches once per worker process."""
+    parse_markdown(_WARMUP_MARKDOWN)
+
+
+def option_labels(count: int) -> Tuple[str, ...]:
+    """Return the labels for ``count`` options in order.
+
+    Past Z the labels keep counting code points, as chr(65 + i) always did.
+    """
+    if count <= len(_LABELS):
+        return _LABELS[:count]
+    return tuple(chr(65 + i) for i in range(count))
 
 
 def parse_chunk(chunk_content: str) -> List[Dict[str, Any]]:
@@ -20,18 +42,48 @@ def parse_chunk(chunk_content: str) -> List[Dict[str, Any]]:
     # Use existing parser (already extracts images and latex per question)
     questions = parse_markdown(chunk_content)
 
-    # Convert to serializable dicts
+    # Convert to serializable dicts. Dedup hashes are computed here so the
+    # hashing runs in parallel instead of in the coordinator's write loop.
     documents = []
     for q in questions:
+        images = q.images or []  # Parser already extracted per question
+        latex_formulas = q.latex_formulas or []  # Parser already extracted per question
+        options = q.options or []
         doc = {
             "content": q.content,
             "question_type": q.question_type,
-            "options": q.options or [],
+            "options": options,
             "answer": q.answer,
             "explanation": q.explanation,
-            "images": q.images or [],  # Parser already extracted per question
-            "latex_formulas": q.latex_formulas or []  # Parser already extracted per question
+            "images": images,
+            "latex_formulas": latex_formulas,
+            "image_hashes": [ImageDocument.from_url(url).hash for url in images],
+            "latex_hashes": [LatexDocument.from_formula(formula).hash for formula in latex_formulas],
+            "option_hashes": [
+                OptionDocument.from_content(label, content).hash
+                for label, content in zip(option_labels(len(options)), options)
+            ],
         }
         documents.append(doc)
 
     return documents
+
+
+def parse_file_chunk(task: Tuple[str, int, int]) -> List[Dict[str, Any]]:
+    """Read a byte range of a file and parse it with parse_chunk.
+
+    The coordinator sends only ``(file_path, start, end)`` so each task
+    pickles a few ints instead of the chunk text.
+
+    Args:
+        task: Tuple of (file_path, start_byte, end_byte)
+
+    Returns:
+        List of dicts representing QuestionDocument objects
+    """
+    file_path, start, end = task
+    with open(file_path, 'rb') as f:
+        f.seek(start)
+        chunk_content = f.read(end - start).decode('utf-8')
+
+    return parse_chunk(chunk_content)
@@ -1,96 +1,153 @@
-from typing import List
+from itertools import islice
+from typing import Iterator, List, Optional, Sequence
 import re
+import string
 from .models import Question
 from .image_processor import extract_all
 
 # Pre-compiled regex patterns for performance
-_NUMBERED_PATTERN = re.compile(r'(?:^|\n)(\d+\.\s+.*?)(?=\n\d+\.|\n\s*---|\n\s*\n+|\Z)', re.DOTALL)
-_SEPARATOR_PATTERN = re.compile(r'(?:^|\n\s*---\s*\n)(.*?)(?=\n\s*---|\n\d+\.|\n\s*\n+|\Z)', re.DOTALL)
-_OPTION_PATTERN = re.compile(r'^[A-Z]\.\s*(.+)$')
+# Question boundaries. Each starts with a literal newline, so a search jumps
+# from line start to line start instead of testing a lookahead at every char.
+_NUMBER_MARKER_PATTERN = re.compile(r'\d+\.\s+')
+_NUMBERED_START_PATTERN = re.compile(r'\n(\d+\.\s+)')
+_SEPARATOR_START_PATTERN = re.compile(r'\n\s*---\s*\n')
+_QUESTION_END_PATTERN = re.compile(r'\n(?:\d+\.|\s*---|\s*\n)')
+# An option line "A. text"; the group spans the text without surrounding whitespace
+_OPTION_PATTERN = re.compile(r'^[^\S\n]*[A-Z]\.[^\S\n]*(\S(?:.*\S)?)[^\S\n]*$', re.MULTILINE)
 _LEADING_NUMBER_PATTERN = re.compile(r'^\s*\d+\.\s*', re.MULTILINE)
-_OPTION_MARKER_PATTERN = re.compile(r'^[A-Z]\.\s')
-_IMAGE_TAG_PATTERN = re.compile(r'!\[.*?\]\(.*?\)')
 _EMPTY_LINE_SPLIT_PATTERN = re.compile(r'\n\s*\n\s*\n+')
+# Letters that can open a multiple-choice option line (a.-f., either case)
+_MC_OPTION_LETTERS = frozenset('abcdefABCDEF')
+# Letters that open an option in parsed content ("A. text"); uppercase only
+_OPTION_MARKER_LETTERS = frozenset(string.ascii_uppercase)
+# A fill-in blank is a run of at least four underscores
+_BLANK_MARKER = '____'
+
+def _count_option_lines(content: str) -> int:
+    """Count lines that start with an option marker like "A. text".
+
+    A marker is a letter a-f (either case) and a dot at the start of the
+    line, after optional indentation, followed by a space or tab and more
+    text. Checking the first few characters of each line is much cheaper
+    than running a multiline regex over the whole question.
+    """
+    count = 0
+    for line in content.split('\n'):
+        line = line.lstrip()
+        if (
+            len(line) > 3
+            and line[0] in _MC_OPTION_LETTERS
+            and line[1] == '.'
+            and line[2] in ' \t'
+            and not line[3:].isspace()
+        ):
+            count += 1
+    return count
+
 
 def detect_question_type(content: str) -> str:
     """Detect the type of question based on content patterns."""
-    content_lower = content.lower()
-
-    # Check for multiple choice patterns
     # Only detect as multiple choice if there are at least 2 options
     # and they appear at the start of lines (not in the middle of sentences)
-    option_patterns = ["a.", "b.", "c.", "d.", "e.", "f."]
-    option_count = 0
-
-    # Split content into lines and check for option markers at line beginnings
-    lines = content_lower.split('\n')
-    for line in lines:
-        line = line.strip()
-        # Check if line starts with an option marker followed by space
-        for pattern in option_patterns:
-            if line.startswith(pattern + ' ') or line.startswith(pattern + '\t'):
-                option_count += 1
-                break  # Only count one option per line
-
-    # Require at least 2 distinct option markers to be considered multiple choice
-    if option_count >= 2:
+    if _count_option_lines(content) >= 2:
         return "multiple_choice"
 
-    # Check for true/false patterns
-    if any(marker in content_lower for marker in ["true", "false", "正确", "错误"]):
+    # True/false markers take priority over blanks wherever they appear.
+    # Plain substring searches beat a regex scan for fixed markers like these;
+    # true/false match in any case (no non-ASCII character lowercases to
+    # these ASCII letters, so lower() cannot create a false hit)
+    lowered = content.lower()
+    if 'true' in lowered or 'false' in lowered or '正确' in content or '错误' in content:
         return "true_false"
 
-    # Check for fill-in-the-blank patterns
-    if "_____" in content or "____" in content:
-        return "fill_in_blank"
-
-    return "subjective"
+    return "fill_in_blank" if _BLANK_MARKER in content else "subjective"
 
 def parse_options(content: str) -> List[str]:
     """Extract options from multiple choice questions."""
-    options = []
-
-    for line in content.split('\n'):
-        match = _OPTION_PATTERN.match(line.strip())
-        if match:
-            options.append(match.group(1).strip())
+    return _OPTION_PATTERN.findall(content)
 
-    return options
+def _question_end(content: str, pos: int) -> int:
+    """Return where the question running from pos ends.
 
-def split_questions(content: str) -> List[str]:
+    That is the next line that is numbered, a ``---`` separator or blank,
+    or the end of the content.
+    """
+    match = _QUESTION_END_PATTERN.search(content, pos)
+    return match.start() if match else len(content)
+
+
+def _iter_numbered(content: str) -> Iterator[str]:
+    """Yield questions that start with a number like "1." at a line start."""
+    match = _NUMBER_MARKER_PATTERN.match(content)
+    if match:
+        start, body = 0, match.end()
+    else:
+        match = _NUMBERED_START_PATTERN.search(content)
+        if not match:
+            return
+        start, body = match.start(1), match.end(1)
+
+    while True:
+        end = _question_end(content, body)
+        question = content[start:end].strip()
+        if question:
+            yield question
+
+        match = _NUMBERED_START_PATTERN.search(content, end)
+        if not match:
+            return
+        start, body = match.start(1), match.end(1)
+
+
+def _iter_separated(content: str) -> Iterator[str]:
+    """Yield the leading text and the questions following each ``---`` line."""
+    end = _question_end(content, 0)
+    if end == 0 and content:
+        # The leading text is empty; it extends to the next boundary instead
+        end = _question_end(content, 1)
+    question = content[:end].strip()
+    if question:
+        yield question
+
+    while True:
+        match = _SEPARATOR_START_PATTERN.search(content, end)
+        if not match:
+            return
+        end = _question_end(content, match.end())
+        question = content[match.end():end].strip()
+        if question:
+            yield question
+
+
+def split_questions(content: str) -> Iterator[str]:
     """Split markdown content into individual questions.
 
+    Questions are yielded as they are found; a pattern is only committed to
+    once it has produced at least two of them.
+
     Args:
         content: Markdown content containing one or more questions
 
-    Returns:
-        List of individual question strings
+    Yields:
+        Individual question strings
     """
-    # Find all question boundaries using multiple patterns
-    questions = []
-
-    # Find numbered questions first
-    matches = _NUMBERED_PATTERN.findall(content)
-    if matches:
-        questions = [match.strip() for match in matches if match.strip()]
-        if len(questions) > 1:
-            return questions
-
-    # If no numbered questions, try separator pattern
-    matches = _SEPARATOR_PATTERN.findall(content)
-    if matches:
-        questions = [match.strip() for match in matches if match.strip()]
-        if len(questions) > 1:
-            return questions
+    # Try numbered questions first, then the separator pattern
+    for scan in (_iter_numbered, _iter_separated):
+        questions = scan(content)
+        first_two = list(islice(questions, 2))
+        if len(first_two) > 1:
+            yield from first_two
+            yield from questions
+            return
 
     # If still no good split, try splitting by multiple empty lines
-    questions = _EMPTY_LINE_SPLIT_PATTERN.split(content)
-    questions = [q.strip() for q in questions if q.strip()]
+    questions = [q for q in map(str.strip, _EMPTY_LINE_SPLIT_PATTERN.split(content)) if q]
     if len(questions) > 1:
-        return questions
+        yield from questions
+        return
 
     # If no clear splitting pattern is found, treat as single question
-    return [content.strip()]
+    yield content.strip()
 
 
 def clean_question_content(content: str) -> str:
@@ -115,23 +172,30 @@ def clean_question_content(content: str) -> str:
         if not line:
             continue
         # Check if this line starts with an option marker (A., B., etc.)
-        if _OPTION_MARKER_PATTERN.match(line):
+        if (
+            len(line) > 2
+            and line[0] in _OPTION_MARKER_LETTERS
+            and line[1] == '.'
+            and line[2].isspace()
+        ):
             break  # Stop at first option
         question_lines.append(line)
 
     return ' '.join(question_lines).strip()
 
 
-def parse_markdown(content: str) -> List[Question]:
-    """Parse markdown content and extract questions."""
-    questions_content = split_questions(content)
-    questions = []
+def iter_markdown(content: str) -> Iterator[Question]:
+    """Parse markdown content and yield questions one at a time.
 
-    for q_content in questions_content:
+    Each Question is built only when the caller asks for it, so a consumer
+    that writes them out as they arrive never holds the whole list.
+    """
+    for q_content in split_questions(content):
         question_type = detect_question_type(q_content)
         options = []
 
-        # Extract all media content in a single pass
+        # Extract all media content in a single pass; the same scan also
+        # yields the content with image tags removed
         extracted = extract_all(q_content)
         images = extracted.images
         latex_formulas = extracted.latex_formulas
@@ -139,18 +203,40 @@ def parse_markdown(content: str) -> List[Question]:
         if question_type == "multiple_choice":
             options = parse_options(q_content)
 
-        # Remove image tags from content
-        clean_content = _IMAGE_TAG_PATTERN.sub('', q_content).strip()
+        clean_content = extracted.text.strip()
 
         # Clean and normalize the question content
         clean_content = clean_question_content(clean_content)
 
-        questions.append(Question(
+        yield Question(
             content=clean_content,
             question_type=question_type,
             options=options if options else None,
             images=images if images else None,
             latex_formulas=latex_formulas if latex_formulas else None
-        ))
+        )
+
+
+def parse_markdown(content: str) -> List[Question]:
+    """Parse markdown content and extract questions."""
+    return list(iter_markdown(content))
+
+
+def parse_many(documents: Sequence[str], workers: Optional[int] = None) -> List[List[Question]]:
+    """Parse several markdown documents, one per task, across processes.
+
+    Args:
+        documents: Markdown contents to parse
+        workers: Number of worker processes (default: CPU count)
+
+    Returns:
+        The question list of each document, in input order
+    """
+    if len(documents) < 2 or workers == 1:
+        return [parse_markdown(document) for document in documents]
+
+    # Imported here so single-document parsing never loads multiprocessing
+    from multiprocessing import Pool
 
-    return questions
\ No newline at end of file
+    with Pool(workers) as pool:
+        return pool.map(parse_markdown, documents)
@@ -5,6 +5,9 @@ Performance benchmark script for comparing Python and Rust implementations of MD
 This script tests parsing performance with various file sizes and complexity levels.
 """
 
+import contextlib
+import functools
+import io
 import time
 import sys
 import os
@@ -12,8 +15,9 @@ import statistics
 import subprocess
 import tempfile
 import zipfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 import tracemalloc
 
 # Add src directory to path
@@ -22,57 +26,54 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "src"))
 from md2db.parser import parse_markdown
 
 
-def generate_test_questions(count: int) -> str:
-    """Generate test markdown content with specified number of questions."""
-    questions = []
-    for i in range(count):
-        q_type = i % 4
-        if q_type == 0:
-            # Multiple Choice
-            questions.append(f"""
-{i+1}. What is {i} + {i}?
+# Question templates cycled by index: multiple choice, true/false,
+# fill in the blank, subjective with LaTeX
+_QUESTION_TEMPLATES = (
+    """
+{n}. What is {i} + {i}?
 
 A. {i}
-B. {i*2}
-C. {i*3}
-D. {i*4}
+B. {i2}
+C. {i3}
+D. {i4}
 
 Answer: B
-""")
-        elif q_type == 1:
-            # True/False
-            questions.append(f"""
-{i+1}. The value of {i} + {i} equals {i*2}.
+""",
+    """
+{n}. The value of {i} + {i} equals {i2}.
 
 True
-""")
-        elif q_type == 2:
-            # Fill in the blank
-            questions.append(f"""
-{i+1}. The capital of country {i} is _____.
+""",
+    """
+{n}. The capital of country {i} is _____.
 
 Answer: Capital {i}
-""")
-        else:
-            # Subjective with LaTeX
-            questions.append(f"""
-{i+1}. Explain the mathematical formula: $x^2 + y^2 = z^2$
+""",
+    """
+{n}. Explain the mathematical formula: $x^2 + y^2 = z^2$
 
 Answer: This is the Pythagorean theorem.
-""")
-    return "\n".join(questions)
+""",
+)
+
+
+def generate_test_questions(count: int) -> str:
+    """Generate test markdown content with specified number of questions."""
+    return "\n".join(
+        _QUESTION_TEMPLATES[i % 4].format(n=i + 1, i=i, i2=i * 2, i3=i * 3, i4=i * 4)
+        for i in range(count)
+    )
 
 
 def create_test_zip(content: str, num_images: int = 5) -> bytes:
     """Create a test ZIP file with markdown and images."""
-    with tempfile.NamedTemporaryFile(suffix='.zip', delete=False) as f:
-        with zipfile.ZipFile(f.name, 'w', zipfile.ZIP_DEFLATED) as zf:
-            zf.writestr('exam.md', content)
-            for i in range(num_images):
-                # Create dummy image data
-                zf.writestr(f'image{i}.png', b'fake image data ' * 100)
-        with open(f.name, 'rb') as rf:
-            return rf.read()
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr('exam.md', content)
+        for i in range(num_images):
+            # Create dummy image data
+            zf.writestr(f'image{i}.png', b'fake image data ' * 100)
+    return buffer.getvalue()
 
 
 def benchmark_python_parsing(content: str, iterations: int = 10) -> dict:
@@ -82,34 +83,32 @@ def benchmark_python_parsing(content: str, iterations: int = 10) -> dict:
     print(f"{'='*60}")
 
     times = []
-    memory_usage = []
 
+    # Timed runs stay free of tracemalloc hooks, which would dominate the timing
     for i in range(iterations):
-        tracemalloc.start()
         start = time.perf_counter()
-
         questions = parse_markdown(content)
+        times.append(time.perf_counter() - start)
 
-        elapsed = time.perf_counter() - start
-        current, peak = tracemalloc.get_traced_memory()
-        tracemalloc.stop()
-
-        times.append(elapsed)
-        memory_usage.append(peak / 1024 / 1024)  # Convert to MB
+    question_count = len(questions)
+    print(f"  Parsed {question_count} questions")
 
-        if i == 0:
-            print(f"  Parsed {len(questions)} questions")
+    # One dedicated run measures peak memory
+    tracemalloc.start()
+    parse_markdown(content)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
 
     avg_time = statistics.mean(times)
     std_time = statistics.stdev(times) if len(times) > 1 else 0
-    avg_memory = statistics.mean(memory_usage)
+    avg_memory = peak / 1024 / 1024  # Convert to MB
 
     return {
         'avg_time': avg_time,
         'std_time': std_time,
         'avg_memory_mb': avg_memory,
-        'questions_per_second': len(parse_markdown(content)) / avg_time,
-        'question_count': len(parse_markdown(content))
+        'questions_per_second': question_count / avg_time,
+        'question_count': question_count
     }
 
 
@@ -125,45 +124,44 @@ def benchmark_rust_parsing(content: str, iterations: int = 10) -> dict:
         temp_file = f.name
 
     try:
-        times = []
-        for i in range(iterations):
-            start = time.perf_counter()
-
+        # Parse many times inside one process so the samples measure parsing,
+        # not fork/exec and dynamic linking of a fresh binary
+        inner_iterations = iterations * 10
+        command = ['parse', temp_file, '--bench-iterations', str(inner_iterations)]
+
+        # Output stays as bytes; only the short stderr report is inspected
+        result = subprocess.run(
+            ['./target/release/md2db'] + command,
+            capture_output=True,
+            timeout=300
+        )
+
+        if result.returncode != 0:
+            print(f"  Warning: Rust binary returned error: {result.stderr.decode(errors='replace')}")
+            # Try debug binary if release doesn't exist
             result = subprocess.run(
-                ['./target/release/md2db', 'parse', temp_file],
+                ['./target/debug/md2db'] + command,
                 capture_output=True,
-                text=True,
-                timeout=30
+                timeout=300
             )
-
-            elapsed = time.perf_counter() - start
-            times.append(elapsed)
-
             if result.returncode != 0:
-                print(f"  Warning: Rust binary returned error: {result.stderr}")
-                # Try debug binary if release doesn't exist
-                if i == 0:
-                    result = subprocess.run(
-                        ['./target/debug/md2db', 'parse', temp_file],
-                        capture_output=True,
-                        text=True,
-                        timeout=30
-                    )
-                    if result.returncode != 0:
-                        print("  Rust benchmark failed - binary may need to be compiled")
-                        return None
-
-        avg_time = statistics.mean(times)
-        std_time = statistics.stdev(times) if len(times) > 1 else 0
-
-        # Try to get question count from output
-        question_count = 100  # Default assumption
-        try:
-            import json
-            output = json.loads(result.stdout)
-            question_count = len(output)
-        except:
-            pass
+                print("  Rust benchmark failed - binary may need to be compiled")
+                return None
+
+        elapsed = None
+        question_count = None
+        for line in result.stderr.splitlines():
+            if line.startswith(b'bench_elapsed_secs='):
+                elapsed = float(line.split(b'=', 1)[1])
+            elif line.startswith(b'COUNT:'):
+                question_count = int(line[len(b'COUNT:'):])
+        if elapsed is None or question_count is None:
+            print("  Rust binary did not report its parse time and question count")
+            return None
+
+        avg_time = elapsed / inner_iterations
+        # Only the total is reported, so there is no per-sample spread
+        std_time = 0
 
         return {
             'avg_time': avg_time,
@@ -181,6 +179,33 @@ def benchmark_rust_parsing(content: str, iterations: int = 10) -> dict:
         os.unlink(temp_file)
 
 
+@functools.lru_cache(maxsize=1)
+def _rustc_version() -> Optional[str]:
+    """Return the ``rustc --version`` string, spawning rustc at most once."""
+    try:
+        rust_version = subprocess.run(['rustc', '--version'], capture_output=True, text=True)
+    except FileNotFoundError:
+        return None
+    if rust_version.returncode != 0:
+        return None
+    return rust_version.stdout.strip()
+
+
+def _bench_one_size(size: int) -> Tuple[str, dict, Optional[dict]]:
+    """Benchmark Python and Rust for one size, capturing what they print."""
+    log = io.StringIO()
+    with contextlib.redirect_stdout(log):
+        content = generate_test_questions(size)
+
+        # Benchmark Python
+        python_result = benchmark_python_parsing(content, iterations=10)
+
+        # Benchmark Rust (if available)
+        rust_result = benchmark_rust_parsing(content, iterations=10)
+
+    return log.getvalue(), python_result, rust_result
+
+
 def run_comprehensive_benchmark():
     """Run comprehensive benchmark across different file sizes."""
     print("\n" + "="*80)
@@ -192,31 +217,34 @@ def run_comprehensive_benchmark():
     print(f"  CPU Cores: {os.cpu_count()}")
     print(f"  Python Version: {sys.version}")
 
-    try:
-        rust_version = subprocess.run(['rustc', '--version'], capture_output=True, text=True)
-        if rust_version.returncode == 0:
-            print(f"  Rust Version: {rust_version.stdout.strip()}")
-        else:
-            print("  Rust Version: Not installed")
-    except FileNotFoundError:
-        print("  Rust Version: Not installed")
+    print(f"  Rust Version: {_rustc_version() or 'Not installed'}")
 
     test_sizes = [10, 50, 100, 500, 1000]
     results = []
 
+    # Sizes are independent, so sweep them concurrently when every size can
+    # have a core of its own, and replay each size's captured output in order
+    # afterwards. With fewer cores the sizes would time-slice and skew each
+    # other's timings, so they run one after another instead.
+    concurrent = (os.cpu_count() or 1) >= len(test_sizes)
+    by_size = {}
+    if concurrent:
+        with ProcessPoolExecutor(max_workers=len(test_sizes)) as executor:
+            futures = {executor.submit(_bench_one_size, size): size for size in test_sizes}
+            for future in as_completed(futures):
+                by_size[futures[future]] = future.result()
+    else:
+        for size in test_sizes:
+            by_size[size] = _bench_one_size(size)
+
     for size in test_sizes:
+        log, python_result, rust_result = by_size[size]
         print(f"\n{'='*80}")
         print(f"Testing with {size} questions")
         print(f"{'='*80}")
+        print(log, end="")
 
-        content = generate_test_questions(size)
-
-        # Benchmark Python
-        python_result = benchmark_python_parsing(content, iterations=10)
         results.append(('Python', size, python_result))
-
-        # Benchmark Rust (if available)
-        rust_result = benchmark_rust_parsing(content, iterations=10)
         if rust_result:
             results.append(('Rust', size, rust_result))
 
@@ -232,6 +260,10 @@ def run_comprehensive_benchmark():
     print("\n" + "="*80)
     print("Performance Summary")
     print("="*80)
+    if concurrent:
+        print(f"Note: the {len(test_sizes)} sizes ran concurrently, one per core. They share "
+              "memory bandwidth and caches, so timings are comparable with each other, "
+              "not with a serial run.")
     print(f"{'Implementation':<15} {'Questions':<12} {'Avg Time (s)':<15} {'Q/s':<12} {'Memory (MB)':<12}")
     print("-"*80)
 
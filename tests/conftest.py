@@ -0,0 +1,45 @@
+import os
+import sys
+import uuid
+
+import pytest
+from pymongo import MongoClient
+
+# Make the src layout importable as ``md2db`` for every test module; pytest
+# loads this file before collecting any of them
+_SRC_DIR = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+if _SRC_DIR not in sys.path:
+    sys.path.insert(0, _SRC_DIR)
+
+
+@pytest.fixture(scope="session")
+def mongo_client():
+    """Provide one MongoDB client shared by the whole test session."""
+    client = MongoClient("mongodb://localhost:27017", maxPoolSize=4)
+    yield client
+    client.close()
+
+
+@pytest.fixture(scope="session")
+def api_client():
+    """Provide one FastAPI TestClient shared by the whole test session."""
+    from fastapi.testclient import TestClient
+    from md2db.api import app
+
+    # Entering the client runs the app's startup once for the whole session
+    with TestClient(app) as client:
+        yield client
+
+
+@pytest.fixture
+def clean_db(mongo_client):
+    """Provide a clean database for testing.
+
+    Each test gets its own freshly named database, dropped afterwards with a
+    single command instead of emptying every collection.
+    """
+    # The xdist worker id keeps databases from parallel runs easy to tell apart
+    worker_id = os.environ.get("PYTEST_XDIST_WORKER", "gw0")
+    db = mongo_client[f"md2db_test_{worker_id}_{uuid.uuid4().hex}"]
+    yield db
+    mongo_client.drop_database(db.name)
@@ -5,18 +5,18 @@ Generate performance comparison charts for MD2DB.
 This script creates visual representations of the performance data.
 """
 
+import importlib.util
 import json
 import sys
 from pathlib import Path
 
-# Try to import matplotlib, fall back to text-based charts if not available
-try:
-    import matplotlib.pyplot as plt
-    import matplotlib
-    matplotlib.use('Agg')  # Non-interactive backend
-    HAS_MATPLOTLIB = True
-except ImportError:
-    HAS_MATPLOTLIB = False
+# Only check that matplotlib exists; it is imported when charts are drawn,
+# so text-only runs skip its import cost. Falls back to text-based charts.
+HAS_MATPLOTLIB = importlib.util.find_spec("matplotlib") is not None
+
+# Resolution of the saved PNGs; 150 DPI reads the same on screen and in CI
+# artifacts at a quarter of the pixels of 300 DPI
+CHART_DPI = 150
 
 
 def load_results(json_file: str = "performance_results.json") -> list:
@@ -75,6 +75,11 @@ def generate_matplotlib_charts(results: list, output_dir: str = "."):
         print("  pip install matplotlib")
         return
 
+    import matplotlib
+    matplotlib.use('Agg')  # Non-interactive backend
+    import matplotlib.pyplot as plt
+    import numpy as np  # always installed alongside matplotlib
+
     questions = [r['questions'] for r in results]
     times = [r['avg_time_ms'] for r in results]
     throughput = [r['questions_per_second'] for r in results]
@@ -94,7 +99,7 @@ def generate_matplotlib_charts(results: list, output_dir: str = "."):
     ax1.set_yscale('log')
 
     # 2. Throughput
-    colors = plt.cm.viridis([i/len(throughput) for i in range(len(throughput))])
+    colors = plt.cm.viridis(np.arange(len(throughput)) / len(throughput))
     ax2.bar(range(len(questions)), throughput, color=colors)
     ax2.set_xlabel('Number of Questions', fontsize=12)
     ax2.set_ylabel('Throughput (questions/sec)', fontsize=12)
@@ -127,7 +132,8 @@ def generate_matplotlib_charts(results: list, output_dir: str = "."):
 
     # Save the figure
     output_file = Path(output_dir) / "performance_charts.png"
-    plt.savefig(output_file, dpi=300, bbox_inches='tight')
+    fig.savefig(output_file, dpi=CHART_DPI, bbox_inches='tight')
+    plt.close(fig)
     print(f"\n✓ Charts saved to: {output_file}")
 
     # Create a summary statistics chart
@@ -151,22 +157,37 @@ def generate_matplotlib_charts(results: list, output_dir: str = "."):
     ax.axis('off')
 
     output_file2 = Path(output_dir) / "performance_summary.png"
-    plt.savefig(output_file2, dpi=300, bbox_inches='tight')
+    fig2.savefig(output_file2, dpi=CHART_DPI, bbox_inches='tight')
+    plt.close(fig2)
     print(f"✓ Summary chart saved to: {output_file2}")
 
 
 def generate_performance_summary(results: list) -> dict:
     """Generate summary statistics."""
-    total_questions = sum(r['questions'] for r in results)
-    total_time = sum(r['avg_time_ms'] * r['questions'] for r in results) / 1000  # seconds
+    # Accumulate every total in one pass over the results
+    total_questions = 0
+    total_time_ms = 0.0
+    total_throughput = 0.0
+    peak_throughput = float('-inf')
+    total_memory = 0.0
+    for r in results:
+        qps = r['questions_per_second']
+        total_questions += r['questions']
+        total_time_ms += r['avg_time_ms'] * r['questions']
+        total_throughput += qps
+        if qps > peak_throughput:
+            peak_throughput = qps
+        total_memory += r['avg_memory_mb']
+
+    average_throughput = total_throughput / len(results)
 
     return {
         'total_questions_tested': total_questions,
-        'average_throughput': sum(r['questions_per_second'] for r in results) / len(results),
-        'peak_throughput': max(r['questions_per_second'] for r in results),
-        'average_memory_per_question': sum(r['avg_memory_mb'] for r in results) / sum(r['questions'] for r in results) * 1024,  # KB
-        'total_processing_time': total_time,
-        'efficiency_score': sum(r['questions_per_second'] for r in results) / len(results) / 1000,  # Arbitrary score
+        'average_throughput': average_throughput,
+        'peak_throughput': peak_throughput,
+        'average_memory_per_question': total_memory / total_questions * 1024,  # KB
+        'total_processing_time': total_time_ms / 1000,  # seconds
+        'efficiency_score': average_throughput / 1000,  # Arbitrary score
     }
 
 
@@ -1,26 +1,8 @@
 import pytest
-from pymongo import MongoClient
 from src.md2db.mongodb.deduplicator import Deduplicator
 from src.md2db.mongodb.models import OptionDocument, ImageDocument, LatexDocument
 
 
-@pytest.fixture
-def clean_db():
-    """Provide a clean database for testing."""
-    client = MongoClient("mongodb://localhost:27017")
-    db = client["md2db_test"]
-    # Clean up before test
-    db.options.delete_many({})
-    db.images.delete_many({})
-    db.latex_formulas.delete_many({})
-    yield db
-    # Clean up after test
-    db.options.delete_many({})
-    db.images.delete_many({})
-    db.latex_formulas.delete_many({})
-    client.close()
-
-
 def test_deduplicator_get_or_create_option_new(clean_db):
     dedup = Deduplicator(clean_db)
     option = OptionDocument(label="A", content="3")
@@ -72,3 +54,78 @@ def test_deduplicator_get_or_create_latex_existing(clean_db):
     id2 = dedup.get_or_create_latex(latex)
     assert id1 == id2
     assert clean_db.latex_formulas.count_documents({}) == 1
+
+
+def test_deduplicator_recreates_indexes_after_database_drop(clean_db):
+    Deduplicator(clean_db)
+    clean_db.client.drop_database(clean_db.name)
+
+    # A later run on the same client must restore the unique index
+    Deduplicator(clean_db)
+    indexes = clean_db.options.index_information()
+    assert any(info["key"] == [("hash", 1)] and info.get("unique") for info in indexes.values())
+
+
+def test_deduplicator_get_or_create_options_batch(clean_db):
+    dedup = Deduplicator(clean_db)
+    existing_id = dedup.get_or_create_option(OptionDocument(label="A", content="3"))
+    options = [
+        OptionDocument(label="A", content="3"),
+        OptionDocument(label="B", content="4"),
+        OptionDocument(label="B", content="4"),
+    ]
+    ids = dedup.get_or_create_options_batch(options)
+    assert len(ids) == 2
+    assert ids[options[0].hash] == existing_id
+    assert clean_db.options.count_documents({}) == 2
+
+
+def test_deduplicator_get_or_create_images_batch(clean_db):
+    dedup = Deduplicator(clean_db)
+    images = [ImageDocument(url="http://example.com/a.png"), ImageDocument(url="http://example.com/b.png")]
+    ids1 = dedup.get_or_create_images_batch(images)
+    ids2 = dedup.get_or_create_images_batch(images)
+    assert ids1 == ids2
+    assert clean_db.images.count_documents({}) == 2
+
+
+def test_deduplicator_get_or_create_latex_batch_empty(clean_db):
+    dedup = Deduplicator(clean_db)
+    assert dedup.get_or_create_latex_batch([]) == {}
+
+
+def test_deduplicator_reuses_resolved_ids_without_querying():
+    from unittest.mock import MagicMock
+
+    db = MagicMock()
+    db.options.find_one.return_value = None
+    db.options.insert_one.return_value.inserted_id = "abc"
+    dedup = Deduplicator(db)
+    option = OptionDocument(label="A", content="3")
+
+    assert dedup.get_or_create_option(option) == "abc"
+    assert dedup.get_or_create_option(option) == "abc"
+    assert dedup.get_or_create_options_batch([option]) == {option.hash: "abc"}
+    assert db.options.find_one.call_count == 1
+    assert db.options.insert_one.call_count == 1
+    db.options.insert_many.assert_not_called()
+
+
+def test_deduplicator_batch_recovers_from_duplicate_key_race():
+    from unittest.mock import MagicMock
+    from pymongo.errors import BulkWriteError
+
+    db = MagicMock()
+    latex = [LatexDocument(formula="x^2"), LatexDocument(formula="y^2")]
+
+    def insert_many(docs, ordered):
+        docs[0]["_id"] = "new"
+        docs[1]["_id"] = "lost"
+        raise BulkWriteError({"writeErrors": [{"index": 1, "code": 11000}]})
+
+    db.latex_formulas.find.side_effect = [[], [{"hash": latex[1].hash, "_id": "theirs"}]]
+    db.latex_formulas.insert_many.side_effect = insert_many
+    dedup = Deduplicator(db)
+
+    ids = dedup.get_or_create_latex_batch(latex)
+    assert ids == {latex[0].hash: "new", latex[1].hash: "theirs"}
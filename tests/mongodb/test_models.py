@@ -1,5 +1,7 @@
+import hashlib
+
 import pytest
-from src.md2db.mongodb.models import QuestionDocument, OptionDocument, ImageDocument, LatexDocument
+from src.md2db.mongodb.models import QuestionDocument, OptionDocument, ImageDocument, LatexDocument, generate_hash
 
 
 def test_question_document_creation():
@@ -32,3 +34,25 @@ def test_latex_document_creation():
     doc = LatexDocument(formula="\\frac{a}{b}")
     assert doc.formula == "\\frac{a}{b}"
     assert doc.hash is not None
+
+
+def test_generate_hash_is_stable():
+    assert generate_hash("x^2") == generate_hash("x^2")
+    assert generate_hash("x^2") != generate_hash("x^3")
+    # Stored dedup keys are SHA-256 hex digests; existing databases rely on it
+    assert generate_hash("x^2") == hashlib.sha256(b"x^2").hexdigest()
+
+
+def test_side_document_factories_share_instances():
+    assert ImageDocument.from_url("http://example.com/a.png") is ImageDocument.from_url("http://example.com/a.png")
+    assert LatexDocument.from_formula("x^2") is LatexDocument.from_formula("x^2")
+    assert OptionDocument.from_content("A", "3") is OptionDocument.from_content("A", "3")
+    assert OptionDocument.from_content("A", "3").hash == OptionDocument(label="A", content="3").hash
+
+
+def test_side_documents_are_immutable():
+    from dataclasses import FrozenInstanceError
+
+    doc = ImageDocument.from_url("http://example.com/a.png")
+    with pytest.raises(FrozenInstanceError):
+        doc.url = "http://example.com/b.png"
@@ -1,27 +1,8 @@
 import pytest
-from pymongo import MongoClient
 from src.md2db.mongodb.writer import BatchWriter
 from src.md2db.mongodb.models import QuestionDocument
 
 
-@pytest.fixture
-def clean_db():
-    """Provide a clean database for testing."""
-    client = MongoClient("mongodb://localhost:27017")
-    db = client["md2db_test"]
-    db.questions.delete_many({})
-    db.options.delete_many({})
-    db.images.delete_many({})
-    db.latex_formulas.delete_many({})
-    yield db
-    # Cleanup
-    db.questions.delete_many({})
-    db.options.delete_many({})
-    db.images.delete_many({})
-    db.latex_formulas.delete_many({})
-    client.close()
-
-
 def test_batch_writer_accumulates_until_batch_size(clean_db):
     writer = BatchWriter(clean_db, batch_size=3, deduplicator=None)
     doc1 = QuestionDocument(content="Q1", question_type="subjective")
@@ -67,3 +48,50 @@ def test_batch_writer_handles_empty_buffer(clean_db):
     writer = BatchWriter(clean_db, batch_size=10, deduplicator=None)
     writer.flush()  # Should not raise error
     assert clean_db.questions.count_documents({}) == 0
+
+
+def test_batch_writer_uses_given_write_concern():
+    from unittest.mock import MagicMock
+    from pymongo import WriteConcern
+
+    db = MagicMock()
+    writer = BatchWriter(db, batch_size=10, deduplicator=None, write_concern=WriteConcern(w=0))
+    writer.add(QuestionDocument(content="Q1", question_type="subjective"))
+    writer.flush()
+
+    db.questions.with_options.assert_called_once_with(write_concern=WriteConcern(w=0))
+    db.questions.with_options.return_value.insert_many.assert_called_once()
+    db.questions.insert_many.assert_not_called()
+
+
+def test_batch_writer_flushes_on_executor():
+    from unittest.mock import MagicMock
+    from concurrent.futures import ThreadPoolExecutor
+
+    db = MagicMock()
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        writer = BatchWriter(db, batch_size=1, deduplicator=None, executor=executor)
+        writer.add(QuestionDocument(content="Q1", question_type="subjective"))
+        writer.add(QuestionDocument(content="Q2", question_type="subjective"))
+        writer.wait()
+
+    assert db.questions.insert_many.call_count == 2
+
+
+def test_batch_writer_keeps_buffer_when_insert_fails():
+    from unittest.mock import MagicMock
+    from pymongo.errors import AutoReconnect
+
+    db = MagicMock()
+    db.questions.insert_many.side_effect = [AutoReconnect("connection lost"), None]
+    writer = BatchWriter(db, batch_size=10, deduplicator=None)
+    writer.add(QuestionDocument(content="Q1", question_type="subjective"))
+
+    with pytest.raises(AutoReconnect):
+        writer.flush()
+
+    # The retry writes the same document again
+    writer.flush()
+    assert db.questions.insert_many.call_count == 2
+    retried = db.questions.insert_many.call_args_list[1].args[0]
+    assert [doc["content"] for doc in retried] == ["Q1"]
@@ -1,6 +1,5 @@
 import pytest
-import tempfile
-import os
+import mmap
 from src.md2db.parallel.chunker import FileChunker, QUESTION_SEPARATORS
 
 
@@ -11,7 +10,7 @@ def test_question_separators_pattern():
     assert r'^\s*---\s*$' in QUESTION_SEPARATORS
 
 
-def test_file_chunker_creates_chunks():
+def test_file_chunker_creates_chunks(tmp_path):
     """Test that chunker divides file into chunks."""
     # Create a test file with multiple questions
     content = """1. First question
@@ -23,40 +22,120 @@ More content.
 3. Third question
 Even more content.
 """
-    with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.md') as f:
-        f.write(content)
-        temp_path = f.name
+    temp_file = tmp_path / "exam.md"
+    temp_file.write_text(content, encoding='utf-8')
+    temp_path = str(temp_file)
 
-    try:
-        chunker = FileChunker(temp_path, chunk_size_mb=0.001)  # Very small chunks
-        chunks = chunker.create_chunks()
+    chunker = FileChunker(temp_path, chunk_size_mb=0.001)  # Very small chunks
+    chunks = chunker.create_chunks()
 
-        # Should create at least 1 chunk
-        assert len(chunks) >= 1
+    # Should create at least 1 chunk
+    assert len(chunks) >= 1
 
-        # Verify chunks are in order
-        for i in range(len(chunks) - 1):
-            assert chunks[i][0] < chunks[i][1]
-            assert chunks[i][1] <= chunks[i + 1][0]
+    # Verify chunks are in order
+    for i in range(len(chunks) - 1):
+        assert chunks[i][0] < chunks[i][1]
+        assert chunks[i][1] <= chunks[i + 1][0]
 
-    finally:
-        os.unlink(temp_path)
 
-
-def test_file_chunker_single_chunk_for_small_file():
+def test_file_chunker_single_chunk_for_small_file(tmp_path):
     """Test that small files get single chunk."""
     content = "Small content"
-    with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.md') as f:
-        f.write(content)
-        temp_path = f.name
+    temp_file = tmp_path / "exam.md"
+    temp_file.write_text(content, encoding='utf-8')
+    temp_path = str(temp_file)
+
+    chunker = FileChunker(temp_path, chunk_size_mb=10)
+    chunks = chunker.create_chunks()
+
+    # Should create exactly 1 chunk for small file
+    assert len(chunks) == 1
+    assert chunks[0] == (0, len(content))
+
+
+def test_find_next_separator_returns_nearest_match(tmp_path):
+    """Test that the nearest separator wins regardless of pattern order."""
+    content = "tail of question\n---\nmore text\n2. Next question\n"
+    temp_file = tmp_path / "exam.md"
+    temp_file.write_text(content, encoding='utf-8')
+    temp_path = str(temp_file)
+
+    chunker = FileChunker(temp_path, chunk_size_mb=10)
+    with open(temp_path, 'rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            position = chunker._find_next_separator(mm, 0)
+
+    assert position == content.index("---")
+
+
+def test_file_chunker_uses_byte_offsets_for_multibyte_content(tmp_path):
+    """Test that chunk boundaries are byte offsets even for UTF-8 text."""
+    content = "1. 第一个问题\n" * 200 + "2. 第二个问题\n" * 200
+    temp_file = tmp_path / "exam.md"
+    temp_file.write_text(content, encoding='utf-8')
+    temp_path = str(temp_file)
+
+    chunker = FileChunker(temp_path, chunk_size_mb=0.002)
+    chunks = chunker.create_chunks()
+
+    data = content.encode('utf-8')
+    assert chunks[-1][1] == len(data)
+    for start, end in chunks:
+        # Every boundary must decode cleanly on its own
+        data[start:end].decode('utf-8')
+
+
+def test_file_chunker_aligns_large_file_to_separators(tmp_path):
+    """Test that chunks of a file larger than 64KB start at question boundaries."""
+    content = "".join(f"{i}. Question {i}\nSome content here.\n\n" for i in range(1, 5001))
+    temp_file = tmp_path / "exam.md"
+    temp_file.write_text(content, encoding='utf-8')
+    temp_path = str(temp_file)
+
+    chunker = FileChunker(temp_path, chunk_size_mb=0.01)
+    chunks = chunker.create_chunks()
+
+    data = content.encode('utf-8')
+    assert len(data) > 64 * 1024
+    assert len(chunks) > 1
+    assert chunks[0][0] == 0
+    assert chunks[-1][1] == len(data)
+    for (_, end), (start, _) in zip(chunks, chunks[1:]):
+        assert end == start
+        assert data[start:start + 8].split(b".")[0].isdigit()
+
+
+def test_file_chunker_falls_back_to_line_start_without_separators(tmp_path):
+    """Test that chunks split between lines when no separator is in reach."""
+    content = "第一个问题的内容没有分隔符\n" * 2000
+    temp_file = tmp_path / "exam.md"
+    temp_file.write_text(content, encoding='utf-8')
+    temp_path = str(temp_file)
+
+    chunker = FileChunker(temp_path, chunk_size_mb=0.01)
+    chunks = chunker.create_chunks()
+
+    data = content.encode('utf-8')
+    assert len(chunks) > 1
+    assert chunks[-1][1] == len(data)
+    for (_, end), (start, _) in zip(chunks, chunks[1:]):
+        assert end == start
+        assert data[start - 1:start] == b"\n"
+    for start, end in chunks:
+        data[start:end].decode('utf-8')
+
 
-    try:
-        chunker = FileChunker(temp_path, chunk_size_mb=10)
-        chunks = chunker.create_chunks()
+def test_find_next_separator_backs_up_to_codepoint_start(tmp_path):
+    """Test that a file without newlines is never split inside a character."""
+    content = "问题" * 5000
+    temp_file = tmp_path / "exam.md"
+    temp_file.write_text(content, encoding='utf-8')
+    temp_path = str(temp_file)
 
-        # Should create exactly 1 chunk for small file
-        assert len(chunks) == 1
-        assert chunks[0] == (0, len(content))
+    chunker = FileChunker(temp_path, chunk_size_mb=10)
+    with open(temp_path, 'rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            position = chunker._find_next_separator(mm, 4)
 
-    finally:
-        os.unlink(temp_path)
+    # Each character is three bytes, so byte 4 backs up to byte 3
+    assert position == 3
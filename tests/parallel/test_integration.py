@@ -1,32 +1,9 @@
 import pytest
-import tempfile
-import os
-from pymongo import MongoClient
 from src.md2db.parallel.coordinator import ParallelProcessor
 
 
-@pytest.fixture
-def clean_db():
-    """Provide a clean database for testing."""
-    client = MongoClient("mongodb://localhost:27017")
-    db = client["md2db_test"]
-    # Clean up before test
-    db.questions.delete_many({})
-    db.options.delete_many({})
-    db.images.delete_many({})
-    db.latex_formulas.delete_many({})
-    yield db
-    # Cleanup
-    db.questions.delete_many({})
-    db.options.delete_many({})
-    db.images.delete_many({})
-    db.latex_formulas.delete_many({})
-    client.close()
-
-
-def test_integration_with_images_and_latex(clean_db):
-    """Test end-to-end processing with images and latex."""
-    content = """1. What is $\\frac{a}{b}$?
+_CORPUS = {
+    "images_and_latex": """1. What is $\\frac{a}{b}$?
 ![diagram](http://example.com/math.png)
 A. 1
 B. 2
@@ -35,78 +12,16 @@ B. 2
 ![graph](http://example.com/graph.png)
 A. True
 B. False
-"""
-    with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.md') as f:
-        f.write(content)
-        temp_path = f.name
-
-    try:
-        processor = ParallelProcessor(
-            file_path=temp_path,
-            database_uri="mongodb://localhost:27017",
-            database_name="md2db_test",
-            num_workers=2,
-            batch_size=10
-        )
-        result = processor.process()
-
-        assert result["questions_processed"] == 2
-
-        # Check that images were processed (different URLs = 2 images)
-        assert clean_db.images.count_documents({}) == 2
-
-        # Check latex formulas
-        assert clean_db.latex_formulas.count_documents({}) == 2
-
-        # Check that questions exist
-        questions = list(clean_db.questions.find())
-        assert len(questions) == 2
-
-    finally:
-        os.unlink(temp_path)
-
-
-def test_integration_option_deduplication(clean_db):
-    """Test that identical options are deduplicated."""
-    content = """1. Question 1?
+""",
+    "option_deduplication": """1. Question 1?
 A. Same option
 B. Different
 
 2. Question 2?
 A. Same option
 B. Also different
-"""
-    with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.md') as f:
-        f.write(content)
-        temp_path = f.name
-
-    try:
-        processor = ParallelProcessor(
-            file_path=temp_path,
-            database_uri="mongodb://localhost:27017",
-            database_name="md2db_test",
-            num_workers=2,
-            batch_size=10
-        )
-        result = processor.process()
-
-        assert result["questions_processed"] == 2
-
-        # Options with same label but different content are different
-        options = list(clean_db.options.find())
-        # Should have 4 unique options (A: Same option, B: Different for Q1, A: Same option, B: Also different for Q2)
-        # Actually our hash includes label, so "A: Same option" is same hash for both questions
-        # But the content is same, so it should be deduplicated
-        # Let's check the count
-        assert len(options) <= 4  # At most 4, could be less if deduped
-
-    finally:
-        os.unlink(temp_path)
-
-
-def test_integration_full_workflow(clean_db):
-    """Test complete workflow with multiple question types."""
-    content = """1. Multiple choice question?
+""",
+    "full_workflow": """1. Multiple choice question?
 A. Option A
 B. Option B
 C. Option C
@@ -124,33 +39,96 @@ B. 4
 5. Question with image ![chart](http://example.com/chart.png).
 A. Yes
 B. No
-"""
-    with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.md') as f:
-        f.write(content)
-        temp_path = f.name
-
-    try:
-        processor = ParallelProcessor(
-            file_path=temp_path,
-            database_uri="mongodb://localhost:27017",
-            database_name="md2db_test",
-            num_workers=2,
-            batch_size=10
-        )
-        result = processor.process()
-
-        # All 5 questions should be processed
-        assert result["questions_processed"] == 5
-
-        # Check that questions were stored
-        questions = list(clean_db.questions.find())
-        assert len(questions) == 5
-
-        # Check question types
-        question_types = [q["question_type"] for q in questions]
-        assert "multiple_choice" in question_types
-        assert "true_false" in question_types
-        assert "fill_in_blank" in question_types
-
-    finally:
-        os.unlink(temp_path)
+""",
+    # Question bodies far longer than the chunker's separator search window,
+    # so chunk boundaries fall between lines of multi-byte text
+    "cjk_long_questions": "".join(
+        f"{i}. 第{i}个问题？\n" + "这是一个很长的问题描述，没有任何分隔符。\n" * 600 + "\n"
+        for i in range(1, 4)
+    ),
+}
+
+
+@pytest.fixture(scope="session")
+def md_corpus(tmp_path_factory):
+    """Write every integration markdown file once and map names to paths."""
+    corpus_dir = tmp_path_factory.mktemp("corpus")
+    paths = {}
+    for name, content in _CORPUS.items():
+        path = corpus_dir / f"{name}.md"
+        path.write_text(content, encoding="utf-8")
+        paths[name] = str(path)
+    return paths
+
+
+def _process(db, path, **kwargs):
+    """Run the parallel pipeline over one corpus file into ``db``."""
+    kwargs.setdefault("batch_size", 10)
+    processor = ParallelProcessor(
+        file_path=path,
+        database_uri="mongodb://localhost:27017",
+        database_name=db.name,
+        num_workers=2,
+        **kwargs
+    )
+    return processor.process()
+
+
+@pytest.mark.parametrize("name, expected_questions, chunk_size_mb", [
+    ("images_and_latex", 2, None),
+    ("option_deduplication", 2, None),
+    ("full_workflow", 5, None),
+    ("cjk_long_questions", 3, 0.01),
+])
+def test_integration_corpus_questions_stored(clean_db, md_corpus, name,
+                                             expected_questions, chunk_size_mb):
+    """Test that every corpus file is processed and each question stored once."""
+    kwargs = {} if chunk_size_mb is None else {"chunk_size_mb": chunk_size_mb}
+    result = _process(clean_db, md_corpus[name], **kwargs)
+
+    assert result["questions_processed"] >= expected_questions
+    assert clean_db.questions.count_documents({}) == result["questions_processed"]
+    if chunk_size_mb is None:
+        assert result["questions_processed"] == expected_questions
+    else:
+        assert result["chunks_processed"] > 1
+
+
+def test_integration_with_images_and_latex(clean_db, md_corpus):
+    """Test end-to-end processing with images and latex."""
+    _process(clean_db, md_corpus["images_and_latex"])
+
+    # Check that images were processed (different URLs = 2 images)
+    assert clean_db.images.count_documents({}) == 2
+
+    # Check latex formulas
+    assert clean_db.latex_formulas.count_documents({}) == 2
+
+
+def test_integration_option_deduplication(clean_db, md_corpus):
+    """Test that identical options are deduplicated."""
+    _process(clean_db, md_corpus["option_deduplication"])
+
+    # "A. Same option" appears in both questions and hashes the same,
+    # so at most 4 option documents are stored
+    assert clean_db.options.count_documents({}) <= 4
+
+
+def test_integration_full_workflow(clean_db, md_corpus):
+    """Test complete workflow with multiple question types."""
+    _process(clean_db, md_corpus["full_workflow"])
+
+    # Check question types
+    question_types = [q["question_type"] for q in clean_db.questions.find()]
+    assert "multiple_choice" in question_types
+    assert "true_false" in question_types
+    assert "fill_in_blank" in question_types
+
+
+def test_integration_cjk_file_larger_than_one_chunk(clean_db, md_corpus):
+    """Test that multi-byte text spanning several chunks keeps every question."""
+    _process(clean_db, md_corpus["cjk_long_questions"], chunk_size_mb=0.01)
+
+    contents = [q["content"] for q in clean_db.questions.find()]
+    for i in range(1, 4):
+        assert any(f"第{i}个问题" in content for content in contents)
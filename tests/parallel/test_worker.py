@@ -1,5 +1,6 @@
 import pytest
-from src.md2db.parallel.worker import parse_chunk
+from src.md2db.parallel.worker import parse_chunk, parse_file_chunk
+from src.md2db.mongodb.models import ImageDocument, LatexDocument, OptionDocument
 
 
 def test_parse_chunk_single_question():
@@ -38,6 +39,34 @@ def test_parse_chunk_with_images():
     assert "http://example.com/img.png" in result[0]["images"]
 
 
+def test_parse_chunk_extracts_media_per_question():
+    """Test that images and formulas stay with the question they appear in."""
+    chunk_content = """1. First ![a](a.png) with $x^2$
+
+2. Second ![b](b.png) with $y^2$
+"""
+    result = parse_chunk(chunk_content)
+
+    assert len(result) == 2
+    assert result[0]["images"] == ["a.png"]
+    assert result[0]["latex_formulas"] == ["x^2"]
+    assert result[1]["images"] == ["b.png"]
+    assert result[1]["latex_formulas"] == ["y^2"]
+
+
+def test_parse_chunk_emits_dedup_hashes():
+    """Test that workers hash media and options the same way the models do."""
+    chunk_content = "What is ![a](a.png) $x^2$?\nA. 3\nB. 4"
+    result = parse_chunk(chunk_content)
+
+    assert result[0]["image_hashes"] == [ImageDocument(url="a.png").hash]
+    assert result[0]["latex_hashes"] == [LatexDocument(formula="x^2").hash]
+    assert result[0]["option_hashes"] == [
+        OptionDocument(label="A", content="3").hash,
+        OptionDocument(label="B", content="4").hash,
+    ]
+
+
 def test_parse_chunk_returns_serializable_dicts():
     """Test that parse_chunk returns serializable dicts, not objects."""
     chunk_content = "What is 2+2?\nA. 3"
@@ -48,3 +77,55 @@ def test_parse_chunk_returns_serializable_dicts():
     assert isinstance(result[0], dict)
     assert "content" in result[0]
     assert "question_type" in result[0]
+
+
+def test_parse_chunk_shares_question_type_strings():
+    """Test that repeated question types are one string object, even after pickling."""
+    import pickle
+
+    chunk_content = "1. First?\nA. 1\nB. 2\n\n2. Second?\nA. 3\nB. 4\n"
+    result = pickle.loads(pickle.dumps(parse_chunk(chunk_content)))
+
+    assert result[0]["question_type"] == "multiple_choice"
+    assert result[0]["question_type"] is result[1]["question_type"]
+
+
+def test_parse_file_chunk_reads_byte_range(tmp_path):
+    """Test parsing a byte range of a file by offsets."""
+    first = "1. 第一题?\nA. 3\nB. 4\n\n"
+    second = "2. What is 3+3?\nA. 5\nB. 6\n"
+    temp_file = tmp_path / "exam.md"
+    temp_file.write_text(first + second, encoding='utf-8')
+    temp_path = str(temp_file)
+
+    start = len(first.encode('utf-8'))
+    end = start + len(second.encode('utf-8'))
+    result = parse_file_chunk((temp_path, start, end))
+
+    assert len(result) == 1
+    assert result[0]["content"] == "What is 3+3?"
+
+
+def test_option_labels_continue_past_z():
+    """Test that option labels match chr(65 + i) for any option count."""
+    from src.md2db.parallel.worker import option_labels
+
+    assert option_labels(3) == ("A", "B", "C")
+    assert option_labels(28) == tuple(chr(65 + i) for i in range(28))
+
+
+def test_parse_chunk_reuses_lazily_compiled_patterns():
+    """Test that parse_chunk compiles the media patterns once, re or re2 alike."""
+    from src.md2db import image_processor
+
+    content = "1. What is ![a](a.png) $x^2$?\nA. 3\nB. 4\n\n2. True or false?\nTrue"
+    parse_chunk(content)
+    compiled = {name: image_processor._compiled(name) for name in image_processor._PATTERN_SOURCES}
+
+    result = parse_chunk(content)
+
+    assert len(result) == 2
+    for name, pattern in compiled.items():
+        # Cached as a module global on first use, then returned as is
+        assert getattr(image_processor, name) is pattern
+        assert image_processor._compiled(name) is pattern
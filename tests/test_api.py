@@ -1,30 +1,39 @@
 import pytest
-import sys
-import os
 
-# Add src directory to Python path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+# md2db.api is built on FastAPI; skip the module on installs without it
+pytest.importorskip("fastapi")
 
-def test_parse_endpoint():
-    """Test the parse endpoint."""
-    from fastapi.testclient import TestClient
-    from md2db.api import app
+pytestmark = pytest.mark.slow
 
-    client = TestClient(app)
-    response = client.post("/parse", json={"markdown": "What is 2+2?"})
+def test_parse_endpoint(api_client):
+    """Test the parse endpoint."""
+    response = api_client.post("/parse", json={"markdown": "What is 2+2?"})
     assert response.status_code == 200
     data = response.json()
     assert "questions" in data
     assert len(data["questions"]) == 1
     assert data["questions"][0]["content"] == "What is 2+2?"
 
-def test_health_endpoint():
+def test_health_endpoint(api_client):
     """Test the health check endpoint."""
-    from fastapi.testclient import TestClient
-    from md2db.api import app
-
-    client = TestClient(app)
-    response = client.get("/health")
+    response = api_client.get("/health")
     assert response.status_code == 200
     data = response.json()
-    assert data["status"] == "healthy"
\ No newline at end of file
+    assert data["status"] == "healthy"
+
+def test_cache_evicts_least_recently_used():
+    """Test that cache hits are promoted ahead of eviction."""
+    from md2db import api
+
+    api._response_cache.clear()
+    for i in range(api._cache_max_size):
+        api._cache_set(f"key{i}".encode(), [])
+
+    # Touch the oldest entry so it becomes most recently used
+    assert api._cache_get(b"key0") == []
+    api._cache_set(b"new", [])
+
+    assert b"key0" in api._response_cache
+    assert b"key1" not in api._response_cache
+    assert len(api._response_cache) == api._cache_max_size
+    api._response_cache.clear()
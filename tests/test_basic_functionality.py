@@ -1,29 +1,18 @@
 import pytest
-import sys
-import os
-
-# Add src directory to Python path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 def test_version():
     """Test that version is accessible."""
     from md2db import __version__
     assert __version__ == "0.1.0"
 
-def test_main_output(capsys):
-    """Test that main function prints expected output."""
+@pytest.mark.slow
+def test_main_output(tmp_path):
+    """Test that process_file reads a markdown file from disk."""
     from md2db.main import process_file
 
-    # Create a test file
-    import tempfile
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.md', delete=False) as f:
-        f.write("Test question")
-        temp_filename = f.name
+    temp_file = tmp_path / "exam.md"
+    temp_file.write_text("Test question", encoding="utf-8")
 
-    try:
-        result = process_file(temp_filename)
-        assert "questions" in result
-        assert "sql" in result
-    finally:
-        import os
-        os.unlink(temp_filename)
\ No newline at end of file
+    result = process_file(str(temp_file))
+    assert "questions" in result
+    assert "sql" in result
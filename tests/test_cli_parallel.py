@@ -1,10 +1,8 @@
 import pytest
-import tempfile
-import os
 from src.md2db.main import process_file_parallel
 
 
-def test_process_file_parallel_basic():
+def test_process_file_parallel_basic(tmp_path):
     """Test parallel file processing via CLI (requires MongoDB)."""
     # Create a test file
     content = """1. Question 1?
@@ -15,43 +13,43 @@ B. Option B
 A. Option C
 B. Option D
 """
-    with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.md') as f:
-        f.write(content)
-        temp_path = f.name
+    temp_file = tmp_path / "exam.md"
+    temp_file.write_text(content, encoding='utf-8')
+    temp_path = str(temp_file)
 
-    try:
-        # This test requires MongoDB to be running
-        # If MongoDB is not available, the test will fail gracefully
-        result = process_file_parallel(
-            temp_path,
-            database_uri="mongodb://localhost:27017",
-            database_name="md2db_test",
-            num_workers=2,
-            chunk_size_mb=0.001
-        )
-
-        assert "questions_processed" in result
-        assert "chunks_processed" in result
-        assert "num_workers" in result
+    # This test requires MongoDB to be running
+    # If MongoDB is not available, the test will fail gracefully
+    result = process_file_parallel(
+        temp_path,
+        database_uri="mongodb://localhost:27017",
+        database_name="md2db_test",
+        num_workers=2,
+        chunk_size_mb=0.001
+    )
 
-    finally:
-        os.unlink(temp_path)
+    assert "questions_processed" in result
+    assert "chunks_processed" in result
+    assert "num_workers" in result
 
 
-def test_process_file_parallel_parameters():
+def test_process_file_parallel_parameters(tmp_path):
     """Test that parallel function accepts all parameters."""
     # This is a smoke test to verify the function signature
     content = "1. Question?"
-    with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.md') as f:
-        f.write(content)
-        temp_path = f.name
+    temp_file = tmp_path / "exam.md"
+    temp_file.write_text(content, encoding='utf-8')
+    temp_path = str(temp_file)
 
     try:
         # Just verify the function can be called with all parameters
         # (actual MongoDB connection may fail if MongoDB is not running)
         from unittest.mock import patch, MagicMock
 
-        with patch('src.md2db.main.ParallelProcessor') as mock_processor:
+        from src.md2db import main
+
+        main._close_clients()
+        with patch('src.md2db.main.ParallelProcessor') as mock_processor, \
+                patch('src.md2db.main.MongoClient') as mock_client:
             mock_instance = MagicMock()
             mock_instance.process.return_value = {
                 "questions_processed": 1,
@@ -79,5 +77,14 @@ def test_process_file_parallel_parameters():
 
             assert result["questions_processed"] == 1
 
+            # A second file on the same URI reuses the cached client
+            process_file_parallel(temp_path, database_uri="mongodb://custom:27017")
+            mock_client.assert_called_once_with("mongodb://custom:27017")
+            assert mock_processor.call_args[1]["client"] is call_kwargs["client"]
+
+            # Cached clients are closed on exit
+            main._close_clients()
+            mock_client.return_value.close.assert_called_once_with()
+
     finally:
-        os.unlink(temp_path)
+        main._close_clients()
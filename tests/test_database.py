@@ -1,9 +1,4 @@
 import pytest
-import sys
-import os
-
-# Add src directory to Python path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 def test_export_to_sql():
     """Test exporting questions to SQL."""
@@ -76,4 +71,78 @@ def test_sql_injection_protection():
 
     # 验证单引号被正确转义
     # 检查内容的单引号被转义为两个单引号
-    assert "''" in sql
\ No newline at end of file
+    assert "''" in sql
+
+def test_export_to_sql_stream_matches_export():
+    """Test that streaming export writes the same SQL as export_to_sql."""
+    import io
+    from md2db.database import export_to_sql, export_to_sql_stream
+    from md2db.models import Question
+
+    questions = [
+        Question(content="It's 1", question_type="multiple_choice", options=["A", "B"]),
+        Question(content="Question 2", question_type="true_false", images=["http://example.com/x.png"])
+    ]
+    buffer = io.StringIO()
+    export_to_sql_stream(questions, buffer)
+    assert buffer.getvalue() == export_to_sql(questions)
+
+def test_export_to_sql_params_roundtrip():
+    """Test that parameterized rows insert the same data as the SQL script."""
+    import sqlite3
+    from md2db.database import export_to_sql, export_to_sql_params
+    from md2db.models import Question
+
+    questions = [
+        Question(content="What is 2+2?'; DROP TABLE questions; --", question_type="multiple_choice",
+                 options=["A. 3", "B. 4"]),
+        Question(content="It's \"quoted\"", question_type="true_false", images=["http://example.com/x.png"]),
+    ]
+    schema = "CREATE TABLE questions (id INTEGER, content TEXT, question_type TEXT, options TEXT, images TEXT)"
+
+    script_db = sqlite3.connect(":memory:")
+    script_db.execute(schema)
+    script_db.executescript(export_to_sql(questions))
+
+    params_db = sqlite3.connect(":memory:")
+    params_db.execute(schema)
+    params_db.executemany(*export_to_sql_params(questions))
+
+    rows = params_db.execute("SELECT * FROM questions ORDER BY id").fetchall()
+    assert rows[0][1] == questions[0].content
+    assert rows == script_db.execute("SELECT * FROM questions ORDER BY id").fetchall()
+
+def test_export_batched_insert():
+    """Test that batch_size groups rows into multi-row INSERT statements."""
+    import sqlite3
+    from md2db.database import export_to_sql
+    from md2db.models import Question
+
+    questions = [Question(content=f"Question {i}'s", question_type="true_false") for i in range(5)]
+    schema = "CREATE TABLE questions (id INTEGER, content TEXT, question_type TEXT, options TEXT, images TEXT)"
+
+    sql = export_to_sql(questions, batch_size=2)
+    assert sql.count("INSERT INTO") == 3
+
+    batched_db = sqlite3.connect(":memory:")
+    batched_db.execute(schema)
+    batched_db.executescript(sql)
+
+    single_db = sqlite3.connect(":memory:")
+    single_db.execute(schema)
+    single_db.executescript(export_to_sql(questions))
+
+    query = "SELECT * FROM questions ORDER BY id"
+    assert batched_db.execute(query).fetchall() == single_db.execute(query).fetchall()
+
+def test_export_to_copy_escapes_layout_characters():
+    """Test that COPY rows escape tabs, newlines and backslashes."""
+    from md2db.database import export_to_copy
+    from md2db.models import Question
+
+    questions = [Question(content="Line\tone\nline \\two", question_type="subjective", options=["A", "B"])]
+    lines = export_to_copy(questions).splitlines()
+
+    assert lines[0].startswith("COPY questions")
+    assert lines[1].split("\t") == ["0", "Line\\tone\\nline \\\\two", "subjective", "A,B", ""]
+    assert lines[-1] == "\\."
@@ -1,14 +1,9 @@
 import pytest
-import sys
-import os
 
-# Add src directory to Python path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+from md2db.parser import parse_markdown
 
 def test_parse_question_with_images():
     """Test parsing question with images."""
-    from md2db.parser import parse_markdown
-
     markdown = "Question with image ![alt](http://example.com/image.png)"
     questions = parse_markdown(markdown)
     assert len(questions) == 1
@@ -16,8 +11,6 @@ def test_parse_question_with_images():
 
 def test_parse_question_with_multiple_images():
     """Test parsing question with multiple images."""
-    from md2db.parser import parse_markdown
-
     markdown = """Question with images:
 ![first](http://example.com/image1.png)
 ![second](http://example.com/image2.png)"""
@@ -29,8 +22,6 @@ def test_parse_question_with_multiple_images():
 
 def test_parse_question_content_without_images():
     """Test that image tags are removed from content."""
-    from md2db.parser import parse_markdown
-
     markdown = "What is 2+2? ![diagram](image.png)"
     questions = parse_markdown(markdown)
     assert len(questions) == 1
@@ -1,9 +1,4 @@
 import pytest
-import sys
-import os
-
-# Add src directory to Python path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 def test_extract_image_urls():
     """Test extracting image URLs from markdown."""
@@ -33,4 +28,18 @@ def test_extract_local_images():
     content = "Question with local image ![diagram](./images/diagram.png)"
     images = extract_images(content)
     assert len(images) == 1
-    assert images[0] == "./images/diagram.png"
\ No newline at end of file
+    assert images[0] == "./images/diagram.png"
+
+
+def test_extract_all_finds_images_overlapping_latex():
+    """Test that image tags inside or across a LaTeX span are still extracted."""
+    from md2db.image_processor import extract_all
+
+    extracted = extract_all("See $$x + ![fig](fig.png)$$ here")
+    assert extracted.images == ["fig.png"]
+    assert extracted.text == "See $$x + $$ here"
+
+    # The tag starts inside the display formula and ends after it
+    extracted = extract_all("See $$x ![a$$b](b.png) here")
+    assert extracted.images == ["b.png"]
+    assert extracted.text == "See $$x  here"
@@ -1,14 +1,10 @@
 import pytest
-import sys
-import os
 
-# Add src directory to Python path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+from md2db.main import process_file
+from md2db.parser import parse_markdown
 
 def test_complete_question_parsing():
     """Test complete question parsing workflow."""
-    from md2db.parser import parse_markdown
-
     markdown = """
 What is the capital of France?
 
@@ -28,8 +24,6 @@ Explanation: Paris is the capital and largest city of France.
 
 def test_multiple_questions_with_latex():
     """Test parsing multiple questions with LaTeX formulas."""
-    from md2db.parser import parse_markdown
-
     # Test case 1: Multiple questions with separator lines
     markdown1 = """
 What is the solution to the equation $x^2 + 2x + 1 = 0$?
@@ -90,13 +84,9 @@ D. $x = 0$
     assert any("x = -2" in option for option in questions2[0].options)
     assert any("\\pm 2" in option for option in questions2[0].options)
 
-def test_api_integration_with_multiple_questions():
+@pytest.mark.slow
+def test_api_integration_with_multiple_questions(api_client):
     """Test API integration with multiple questions workflow."""
-    from fastapi.testclient import TestClient
-    from md2db.api import app
-
-    client = TestClient(app)
-
     markdown = """
 1. What is 2+2?
 A. 3
@@ -110,7 +100,7 @@ C. Berlin
 
 3. True or False: Python is a programming language.
 """
-    response = client.post("/parse", json={"markdown": markdown})
+    response = api_client.post("/parse", json={"markdown": markdown})
 
     assert response.status_code == 200
     data = response.json()
@@ -119,11 +109,9 @@ C. Berlin
     assert data["questions"][1]["question_type"] == "multiple_choice"
     assert data["questions"][2]["question_type"] == "true_false"
 
-def test_cli_integration_with_multiple_questions():
+@pytest.mark.slow
+def test_cli_integration_with_multiple_questions(tmp_path):
     """Test CLI integration with multiple questions file processing."""
-    from md2db.main import process_file
-    import os
-
     # Create test file with multiple questions
     test_content = """Question 1:
 What is the solution to $x^2 = 4$?
@@ -144,27 +132,21 @@ Question 3:
 True or False: $e^{i\\pi} = -1$
 """
 
-    with open("test_multiple_questions.md", "w", encoding="utf-8") as f:
-        f.write(test_content)
-
-    try:
-        result = process_file("test_multiple_questions.md")
-        assert "questions" in result
-        assert "sql" in result
-        assert len(result["questions"]) == 3
-
-        # Check that LaTeX formulas are preserved in SQL
-        sql_content = result["sql"]
-        assert "x^2 = 4" in sql_content
-        assert "\\int x dx" in sql_content
-        assert "e^{i\\pi} = -1" in sql_content
-
-        # Check question types
-        assert result["questions"][0]["question_type"] == "multiple_choice"
-        assert result["questions"][1]["question_type"] == "subjective"
-        assert result["questions"][2]["question_type"] == "true_false"
-
-    finally:
-        # Clean up
-        if os.path.exists("test_multiple_questions.md"):
-            os.remove("test_multiple_questions.md")
\ No newline at end of file
+    exam_file = tmp_path / "test_multiple_questions.md"
+    exam_file.write_text(test_content, encoding="utf-8")
+
+    result = process_file(str(exam_file))
+    assert "questions" in result
+    assert "sql" in result
+    assert len(result["questions"]) == 3
+
+    # Check that LaTeX formulas are preserved in SQL
+    sql_content = result["sql"]
+    assert "x^2 = 4" in sql_content
+    assert "\\int x dx" in sql_content
+    assert "e^{i\\pi} = -1" in sql_content
+
+    # Check question types
+    assert result["questions"][0]["question_type"] == "multiple_choice"
+    assert result["questions"][1]["question_type"] == "subjective"
+    assert result["questions"][2]["question_type"] == "true_false"
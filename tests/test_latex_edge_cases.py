@@ -1,11 +1,6 @@
 """Test edge cases for LaTeX formula extraction."""
 
 import pytest
-import sys
-import os
-
-# Add src directory to Python path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 from md2db.image_processor import extract_latex_formulas
 
@@ -126,5 +121,26 @@ def test_formula_with_comments():
     assert formulas == ["variable_name"]
 
 
+def test_adjacent_display_formulas():
+    """Test that text between display formulas is not read as inline LaTeX."""
+    content = "Sum: $$x^2$$ + $$y^2$$"
+    formulas = extract_latex_formulas(content)
+    assert formulas == ["x^2", "y^2"]
+
+    # Many stray dollar signs should not produce spurious formulas
+    content = "$" * 10001
+    formulas = extract_latex_formulas(content)
+    assert formulas == []
+
+
+def test_inline_span_does_not_hide_display_formula():
+    """Test that overlapping inline and display spans are both scanned."""
+    assert extract_latex_formulas('$a$$x^2$$') == ["x^2"]
+    # Display formulas come first, then inline ones, each kept once
+    assert extract_latex_formulas('$y_1$ and $$x^2$$') == ["x^2", "y_1"]
+    # An inline span inside a display formula is still found on its own
+    assert extract_latex_formulas('$$a$b+c$$') == ["a$b+c", "b+c"]
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
\ No newline at end of file
@@ -1,9 +1,4 @@
 import pytest
-import sys
-import os
-
-# Add src directory to Python path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 def test_question_creation():
     """Test that Question model can be created with basic fields."""
@@ -38,4 +33,23 @@ def test_question_with_latex():
         question_type="subjective",
         latex_formulas=["\\sqrt{x^2 + y^2}"]
     )
-    assert question.latex_formulas == ["\\sqrt{x^2 + y^2}"]
\ No newline at end of file
+    assert question.latex_formulas == ["\\sqrt{x^2 + y^2}"]
+
+def test_question_to_dict_shares_values():
+    """Test that to_dict returns every field without copying the lists."""
+    from md2db.models import Question
+
+    options = ["3", "4"]
+    question = Question(content="What is 2+2?", question_type="multiple_choice", options=options)
+    result = question.to_dict()
+
+    assert result == {
+        "content": "What is 2+2?",
+        "question_type": "multiple_choice",
+        "options": ["3", "4"],
+        "answer": None,
+        "explanation": None,
+        "images": None,
+        "latex_formulas": None,
+    }
+    assert result["options"] is options
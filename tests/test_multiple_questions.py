@@ -1,15 +1,10 @@
 """Test cases for multiple questions parsing functionality."""
 import pytest
-import sys
-import os
 
-# Add src directory to Python path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+from md2db.parser import parse_markdown
 
 def test_parse_multiple_numbered_questions():
     """Test parsing multiple questions with numeric numbering."""
-    from md2db.parser import parse_markdown
-
     markdown = """1. What is 2+2?
 A. 3
 B. 4
@@ -44,8 +39,6 @@ C. Berlin
 
 def test_parse_multiple_questions_with_separators():
     """Test parsing multiple questions with separator lines."""
-    from md2db.parser import parse_markdown
-
     markdown = """What is 2+2?
 A. 3
 B. 4
@@ -79,8 +72,6 @@ True or False: The Earth is flat."""
 
 def test_parse_mixed_question_types():
     """Test parsing mixed question types in single markdown."""
-    from md2db.parser import parse_markdown
-
     markdown = """1. What is 2+2?
 A. 3
 B. 4
@@ -106,8 +97,6 @@ B. 4
 
 def test_parse_empty_lines_between_questions():
     """Test parsing questions with empty lines as separators."""
-    from md2db.parser import parse_markdown
-
     markdown = """What is 2+2?
 A. 3
 B. 4
@@ -132,8 +121,6 @@ True or False: The Earth is flat."""
 
 def test_single_question_still_works():
     """Test that single question parsing still works after changes."""
-    from md2db.parser import parse_markdown
-
     markdown = "What is 2+2?"
     questions = parse_markdown(markdown)
 
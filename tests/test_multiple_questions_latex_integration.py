@@ -1,11 +1,6 @@
 """Integration tests for multiple questions parsing with LaTeX formulas."""
 
 import pytest
-import sys
-import os
-
-# Add src directory to Python path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 def test_complete_workflow_with_multiple_questions():
     """Test complete workflow from markdown parsing to SQL generation with multiple questions."""
@@ -109,13 +104,9 @@ Answer: True
     assert any("\\cos(\\theta)" in latex for latex in questions[2].latex_formulas)
 
 
-def test_api_multiple_questions_latex():
+@pytest.mark.slow
+def test_api_multiple_questions_latex(api_client):
     """Test API endpoint with multiple questions containing LaTeX."""
-    from fastapi.testclient import TestClient
-    from md2db.api import app
-
-    client = TestClient(app)
-
     markdown = """
 1. Solve: $\\frac{d}{dx}(x^2) = $
 A. $2x$
@@ -129,7 +120,7 @@ Answer: $2$
 3. True or False: $\\lim_{x\\to 0} \\frac{\\sin(x)}{x} = 1$
 """
 
-    response = client.post("/parse", json={"markdown": markdown})
+    response = api_client.post("/parse", json={"markdown": markdown})
     assert response.status_code == 200
 
     data = response.json()
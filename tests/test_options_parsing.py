@@ -1,9 +1,4 @@
 import pytest
-import sys
-import os
-
-# Add src directory to Python path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 def test_parse_multiple_choice_options():
     """Test parsing options from multiple choice questions."""
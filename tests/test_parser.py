@@ -1,14 +1,9 @@
 import pytest
-import sys
-import os
 
-# Add src directory to Python path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+from md2db.parser import detect_question_type, iter_markdown, parse_many, parse_markdown, split_questions
 
 def test_parse_simple_question():
     """Test parsing a simple question."""
-    from md2db.parser import parse_markdown
-
     markdown = "What is 2+2?"
     questions = parse_markdown(markdown)
 
@@ -18,8 +13,6 @@ def test_parse_simple_question():
 
 def test_parse_multiple_choice():
     """Test parsing multiple choice question."""
-    from md2db.parser import parse_markdown
-
     markdown = "What is 2+2?\nA. 3\nB. 4\nC. 5"
     questions = parse_markdown(markdown)
 
@@ -32,8 +25,6 @@ def test_parse_multiple_choice():
 
 def test_extract_latex_inline():
     """Test extracting inline LaTeX formulas."""
-    from md2db.parser import parse_markdown
-
     markdown = "Solve the equation: $x^2 + y^2 = z^2$"
     questions = parse_markdown(markdown)
 
@@ -44,8 +35,6 @@ def test_extract_latex_inline():
 
 def test_extract_latex_display():
     """Test extracting display LaTeX formulas."""
-    from md2db.parser import parse_markdown
-
     markdown = "Integral formula: $$\\int_{0}^{\\infty} e^{-x^2} dx = \\frac{\\sqrt{\\pi}}{2}$$"
     questions = parse_markdown(markdown)
 
@@ -56,8 +45,6 @@ def test_extract_latex_display():
 
 def test_extract_multiple_latex_formulas():
     """Test extracting multiple LaTeX formulas."""
-    from md2db.parser import parse_markdown
-
     markdown = "Derivative: $\\frac{dy}{dx}$ and integral: $$\\int f(x) dx$$"
     questions = parse_markdown(markdown)
 
@@ -69,8 +56,6 @@ def test_extract_multiple_latex_formulas():
 
 def test_detect_multiple_choice_with_single_option():
     """Test that single option doesn't trigger multiple choice detection."""
-    from md2db.parser import detect_question_type
-
     # This should NOT be detected as multiple choice
     content = "What is the capital of France?\nA. Paris"
     question_type = detect_question_type(content)
@@ -78,8 +63,6 @@ def test_detect_multiple_choice_with_single_option():
 
 def test_detect_multiple_choice_with_two_options():
     """Test that two options trigger multiple choice detection."""
-    from md2db.parser import detect_question_type
-
     # This should be detected as multiple choice
     content = "What is the capital of France?\nA. Paris\nB. London"
     question_type = detect_question_type(content)
@@ -87,8 +70,6 @@ def test_detect_multiple_choice_with_two_options():
 
 def test_detect_multiple_choice_with_four_options():
     """Test that four options trigger multiple choice detection."""
-    from md2db.parser import detect_question_type
-
     # This should be detected as multiple choice
     content = "What is 2+2?\nA. 3\nB. 4\nC. 5\nD. 6"
     question_type = detect_question_type(content)
@@ -96,8 +77,6 @@ def test_detect_multiple_choice_with_four_options():
 
 def test_avoid_false_positive_multiple_choice():
     """Test that text containing 'a.' or 'b.' doesn't trigger false positive."""
-    from md2db.parser import detect_question_type
-
     # These should NOT be detected as multiple choice
     test_cases = [
         "This is a. simple text",
@@ -112,24 +91,18 @@ def test_avoid_false_positive_multiple_choice():
 
 def test_true_false_detection_still_works():
     """Test that true/false detection still works correctly."""
-    from md2db.parser import detect_question_type
-
     content = "Is the Earth flat?\nTrue\nFalse"
     question_type = detect_question_type(content)
     assert question_type == "true_false"
 
 def test_fill_in_blank_detection_still_works():
     """Test that fill-in-the-blank detection still works correctly."""
-    from md2db.parser import detect_question_type
-
     content = "Complete the sentence: The capital of France is _____"
     question_type = detect_question_type(content)
     assert question_type == "fill_in_blank"
 
 def test_multiple_choice_with_mixed_case():
     """Test multiple choice detection with mixed case options."""
-    from md2db.parser import detect_question_type
-
     # Test uppercase options
     content_upper = "What is 2+2?\nA. 3\nB. 4\nC. 5"
     question_type = detect_question_type(content_upper)
@@ -142,24 +115,48 @@ def test_multiple_choice_with_mixed_case():
 
 def test_multiple_choice_with_tabs():
     """Test multiple choice detection with tabs after options."""
-    from md2db.parser import detect_question_type
-
     content = "What is 2+2?\nA.\t3\nB.\t4\nC.\t5"
     question_type = detect_question_type(content)
     assert question_type == "multiple_choice"
 
 def test_multiple_choice_with_extra_spaces():
     """Test multiple choice detection with extra spaces."""
-    from md2db.parser import detect_question_type
-
     content = "What is 2+2?\n  A.   3\n  B.   4\n  C.   5"
     question_type = detect_question_type(content)
     assert question_type == "multiple_choice"
 
 def test_not_multiple_choice_with_options_in_middle():
     """Test that options in the middle of sentences don't trigger detection."""
-    from md2db.parser import detect_question_type
-
     content = "The answer is A. correct but B. is also possible"
     question_type = detect_question_type(content)
-    assert question_type != "multiple_choice"
\ No newline at end of file
+    assert question_type != "multiple_choice"
+
+
+def test_split_questions_yields_lazily():
+    """Test that split_questions streams numbered questions in order."""
+    questions = split_questions("1. First?\n2. Second?\n3. Third?")
+    assert next(questions) == "1. First?"
+    assert list(questions) == ["2. Second?", "3. Third?"]
+
+
+def test_iter_markdown_matches_parse_markdown():
+    """Test that iter_markdown yields the questions parse_markdown returns."""
+    content = "1. First?\nA. 1\nB. 2\n2. Second ![a](a.png)?\n3. Third _____."
+    questions = iter_markdown(content)
+    assert next(questions).content == "First?"
+    assert list(questions) == parse_markdown(content)[1:]
+
+
+def test_option_lines_need_text_after_marker():
+    """Test that bare markers and markers past f. don't count as options."""
+    assert detect_question_type("Pick one\nA.\nB.  \nC. \t") != "multiple_choice"
+    assert detect_question_type("Steps\ng. first\nh. second") != "multiple_choice"
+    assert detect_question_type("Pick one\nA) 3\nB) 4") != "multiple_choice"
+
+
+@pytest.mark.slow
+def test_parse_many_matches_parse_markdown():
+    """Test that parse_many returns each document's questions in order."""
+    documents = ["1. First?\nA. 1\nB. 2\n2. Second?", "Solve $x^2$", "3. Third _____."]
+    assert parse_many(documents, workers=2) == [parse_markdown(d) for d in documents]
+    assert parse_many(documents[:1]) == [parse_markdown(documents[0])]
@@ -0,0 +1,19 @@
+import pytest
+
+# Timing runs only when pytest-benchmark is installed
+pytest.importorskip("pytest_benchmark")
+# performance_analysis records its samples in NumPy arrays
+pytest.importorskip("numpy")
+
+from md2db.parser import parse_markdown
+from performance_analysis import generate_test_questions
+
+
+@pytest.mark.benchmark(group="parse")
+def test_parse_1000(benchmark):
+    """Benchmark parsing 1000 mixed questions."""
+    content = generate_test_questions(1000, complexity='mixed')
+
+    questions = benchmark.pedantic(parse_markdown, args=(content,), rounds=20, warmup_rounds=3)
+
+    assert len(questions) == 1000
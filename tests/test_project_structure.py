@@ -1,9 +1,4 @@
 import pytest
-import sys
-import os
-
-# Add src directory to Python path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 def test_md2db_module_exists():
     """Test that md2db module can be imported."""